@@ -0,0 +1,68 @@
+# config_cache.py
+"""
+Shared JSON config cache for the fix_*.py maintenance scripts.
+Parses each config file once per modification and batches writes so
+several fixers run in one process touch each file a single time.
+"""
+
+import os
+import copy
+import json
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger("ConfigCache")
+
+# Configs modified in memory but not yet written back
+_dirty = {}
+
+
+@lru_cache(maxsize=None)
+def _parse(path, mtime_ns):
+    """Parse a JSON file; cached per (path, modification time)."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def load(path):
+    """Load a JSON config, reusing pending or previously parsed data.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Copy of the parsed configuration dictionary, safe to modify
+    """
+    if path in _dirty:
+        return copy.deepcopy(_dirty[path])
+    return copy.deepcopy(_parse(path, os.stat(path).st_mtime_ns))
+
+
+def save(path, config):
+    """Queue a config to be written on the next flush().
+
+    Args:
+        path: Path to the JSON file
+        config: Configuration dictionary to write
+    """
+    _dirty[path] = config
+
+
+def flush():
+    """Write all pending configs to disk.
+
+    Returns:
+        True if every pending config was written, False otherwise
+    """
+    success = True
+    for path, config in list(_dirty.items()):
+        try:
+            with open(path, 'w') as f:
+                json.dump(config, f, indent=2)
+            del _dirty[path]
+        except Exception as e:
+            logger.error("Error writing %s: %s", path, e)
+            success = False
+
+    _parse.cache_clear()
+    return success
@@ -1,18 +1,17 @@
 # file: create_init_files.py
 import os
+from pathlib import Path
 
 
 def create_init_file(directory):
     init_path = os.path.join(directory, "__init__.py")
-    if not os.path.exists(init_path):
-        try:
-            with open(init_path, 'w') as f:
-                pass  # Create empty file
-            print(f"Created {init_path}")
-        except Exception as e:
-            print(f"Error creating {init_path}: {e}")
-    else:
+    try:
+        Path(init_path).touch(exist_ok=False)
+        print(f"Created {init_path}")
+    except FileExistsError:
         print(f"Already exists: {init_path}")
+    except Exception as e:
+        print(f"Error creating {init_path}: {e}")
 
 
 def main():
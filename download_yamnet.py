@@ -1,83 +1,288 @@
 # download_yamnet.py
 import os
+import json
+import http.client
+import urllib.error
 import urllib.request
-import logging
 import sys
-import time
+import random
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler()]
+import sensebridge_logging
+
+logger = sensebridge_logging.setup("ModelDownloader")
+
+# Use a proper User-Agent to avoid 403 errors
+HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
+})
+
+# URLs to try - sometimes the original URL might be blocked
+MODEL_URLS = (
+    "https://storage.googleapis.com/download.tensorflow.org/models/tflite/yamnet/yamnet.tflite",
+    "https://github.com/tensorflow/models/raw/master/research/audioset/yamnet/yamnet.tflite",
+    "https://tfhub.dev/google/lite-model/yamnet/classification/tflite/1?lite-format=tflite"
 )
-logger = logging.getLogger("ModelDownloader")
 
+# Copy buffer size for streaming downloads to disk
+CHUNK_SIZE = 256 * 1024
+
+# Retry settings for each mirror
+MAX_ATTEMPTS = 3
+BACKOFF_INITIAL = 0.5  # seconds
+BACKOFF_MAX = 8.0  # seconds
+
+# One opener shared by all requests; it follows redirects and honours the
+# http(s)_proxy environment variables
+_opener = urllib.request.build_opener()
+
+
+def _backoff_delay(attempt):
+    """Get the exponential backoff delay, with jitter, after a failed attempt."""
+    return min(BACKOFF_INITIAL * 2 ** attempt + random.uniform(0, BACKOFF_INITIAL), BACKOFF_MAX)
+
+
+def _request(url, headers, timeout):
+    """Send a GET request.
+
+    Returns:
+        The response for a 2xx or 304 status
+
+    Raises:
+        urllib.error.HTTPError: For other error statuses
+    """
+    try:
+        return _opener.open(urllib.request.Request(url, headers=headers), timeout=timeout)
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        # Not modified since the cached copy; the error is the response
+        return e
+
+
+def _close_response(future):
+    """Close the response of a mirror request that lost the race."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def open_first_mirror(urls, headers, timeout=30):
+    """Request all mirror URLs concurrently and return the first to respond.
+
+    Args:
+        urls: Mirror URLs to try
+        headers: HTTP headers to send with each request
+        timeout: Socket timeout for each request (seconds)
+
+    Returns:
+        (url, response) tuple for the first successful mirror, or None
+    """
+    finished = threading.Event()
+
+    def open_url(url):
+        for attempt in range(MAX_ATTEMPTS):
+            logger.info("Trying to download from: %s", url)
+            try:
+                return _request(url, headers, timeout)
+            except urllib.error.HTTPError as e:
+                # Only server errors and rate limiting are worth retrying
+                if e.code < 500 and e.code != 429:
+                    raise
+                error = e
+            except (OSError, http.client.HTTPException) as e:
+                error = e
+
+            # Give up after the last attempt or once another mirror has won
+            if attempt == MAX_ATTEMPTS - 1 or finished.wait(_backoff_delay(attempt)):
+                raise error
+
+    executor = ThreadPoolExecutor(max_workers=len(urls))
+    futures = {executor.submit(open_url, url): url for url in urls}
+    winner = None
+
+    try:
+        for future in as_completed(futures):
+            try:
+                response = future.result()
+            except Exception as e:
+                logger.warning("Failed to download from %s: %s", futures[future], e)
+                continue
+            winner = future
+            break
+    finally:
+        # Cancel or close the losing requests without waiting for them
+        finished.set()
+        for future in futures:
+            if future is not winner:
+                future.cancel()
+                future.add_done_callback(_close_response)
+        executor.shutdown(wait=False)
+
+    if winner is None:
+        return None
+    return futures[winner], response
+
+
+def _validators_file(path):
+    """Get the path of the file storing HTTP cache validators for a download."""
+    return path + ".etag"
+
+
+def conditional_headers(path, headers):
+    """Add conditional GET headers for a previously downloaded file.
+
+    Args:
+        path: Path of the downloaded file
+        headers: Base HTTP headers
 
-def download_yamnet_model():
-    """Download the YAMNet model file if it doesn't exist."""
+    Returns:
+        Headers including If-None-Match/If-Modified-Since when known
+    """
+    headers = dict(headers)
+    if not os.path.exists(path):
+        return headers
+
+    try:
+        with open(_validators_file(path), 'r') as f:
+            validators = json.load(f)
+    except (OSError, ValueError):
+        return headers
+
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def save_validators(path, response):
+    """Store the HTTP cache validators of a completed download.
+
+    Args:
+        path: Path of the downloaded file
+        response: HTTP response the file was downloaded from
+    """
+    validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content_length": response.headers.get("Content-Length")
+    }
+    try:
+        with open(_validators_file(path), 'w') as f:
+            json.dump(validators, f)
+    except OSError as e:
+        logger.warning("Could not save cache validators for %s: %s", path, e)
+
+
+def is_unchanged(path, response):
+    """Check whether a response shows the downloaded file is still current.
+
+    Args:
+        path: Path of the downloaded file
+        response: HTTP response from a conditional GET
+
+    Returns:
+        True if the server answered 304 Not Modified, or reports the same
+        Content-Length as both the file on disk and the previous download
+    """
+    if response.status == 304:
+        return True
+
+    content_length = response.headers.get("Content-Length")
+    if not content_length or not os.path.exists(path):
+        return False
+
+    try:
+        with open(_validators_file(path), 'r') as f:
+            validators = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    return (validators.get("content_length") == content_length
+            and os.path.getsize(path) == int(content_length))
+
+
+def stream_to_file(response, out_file):
+    """Copy a response body to a file through a single reused buffer.
+
+    Args:
+        response: HTTP response to read from
+        out_file: Binary file to write to
+    """
+    buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+    while True:
+        count = response.readinto(buffer)
+        if not count:
+            break
+        out_file.write(view[:count])
+
+
+def download_yamnet_model(refresh=False):
+    """Download the YAMNet model file if it doesn't exist.
+
+    Args:
+        refresh: Re-check an existing model against the server, downloading
+            it again only if it has changed
+    """
     model_dir = os.path.join("models", "yamnet_model")
     model_file = os.path.join(model_dir, "yamnet.tflite")
 
     # Create directory if it doesn't exist
-    if not os.path.exists(model_dir):
-        os.makedirs(model_dir, exist_ok=True)
-        logger.info(f"Created directory: {model_dir}")
+    try:
+        Path(model_dir).mkdir(parents=True)
+        logger.info("Created directory: %s", model_dir)
+    except FileExistsError:
+        pass
 
     # Create __init__.py if it doesn't exist
     init_file = os.path.join(model_dir, "__init__.py")
-    if not os.path.exists(init_file):
-        open(init_file, 'a').close()
-        logger.info(f"Created file: {init_file}")
+    try:
+        Path(init_file).touch(exist_ok=False)
+        logger.info("Created file: %s", init_file)
+    except FileExistsError:
+        pass
 
     # Check if model already exists
-    if os.path.exists(model_file):
-        logger.info(f"YAMNet model already exists at {model_file}")
+    if os.path.exists(model_file) and not refresh:
+        logger.info("YAMNet model already exists at %s", model_file)
         return True
 
     # Download the model
     logger.info("Downloading YAMNet model file...")
     try:
-        # Use a proper User-Agent to avoid 403 errors
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
-        }
-
-        # URLs to try - sometimes the original URL might be blocked
-        urls = [
-            "https://storage.googleapis.com/download.tensorflow.org/models/tflite/yamnet/yamnet.tflite",
-            "https://github.com/tensorflow/models/raw/master/research/audioset/yamnet/yamnet.tflite",
-            "https://tfhub.dev/google/lite-model/yamnet/classification/tflite/1?lite-format=tflite"
-        ]
-
-        success = False
-        for url in urls:
-            try:
-                logger.info(f"Trying to download from: {url}")
-                req = urllib.request.Request(url, headers=headers)
-                with urllib.request.urlopen(req) as response, open(model_file, 'wb') as out_file:
-                    data = response.read()
-                    out_file.write(data)
-                success = True
-                logger.info(f"YAMNet model downloaded successfully to {model_file}")
-                break
-            except Exception as e:
-                logger.warning(f"Failed to download from {url}: {str(e)}")
-                time.sleep(1)  # Wait a bit before trying the next URL
-
-        if not success:
+        result = open_first_mirror(MODEL_URLS, conditional_headers(model_file, HEADERS))
+        if result is None:
             logger.error("Failed to download YAMNet model from all sources.")
             return False
 
+        url, response = result
+        if is_unchanged(model_file, response):
+            response.close()
+            logger.info("YAMNet model at %s is up to date", model_file)
+            return True
+
+        # Stream to a temporary file so an interrupted download never
+        # leaves a truncated model behind
+        partial_file = model_file + ".part"
+        with response, open(partial_file, 'wb') as out_file:
+            stream_to_file(response, out_file)
+        os.replace(partial_file, model_file)
+        save_validators(model_file, response)
+        logger.info("YAMNet model downloaded successfully to %s", model_file)
+
         return True
     except Exception as e:
-        logger.error(f"Error downloading YAMNet model: {str(e)}")
+        logger.error("Error downloading YAMNet model: %s", e)
         return False
 
 
 if __name__ == "__main__":
     logger.info("Starting YAMNet model download script")
-    success = download_yamnet_model()
+    success = download_yamnet_model(refresh="--refresh" in sys.argv)
     if success:
         logger.info("YAMNet model setup completed successfully")
         sys.exit(0)
@@ -1,59 +1,113 @@
 import os
-import urllib.request
-import logging
+import io
+import csv
+import sys
+from pathlib import Path
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("LabelsDownloader")
+from download_yamnet import HEADERS, conditional_headers, open_first_mirror, save_validators
+import sensebridge_logging
 
+logger = sensebridge_logging.setup("LabelsDownloader")
 
-def download_yamnet_labels():
-    """Download the YAMNet labels file if it doesn't exist."""
-    model_dir = os.path.join("models", "yamnet_model")
-    labels_file = os.path.join(model_dir, "yamnet_labels.txt")
+# URLs to try for the labels file
+LABEL_URLS = (
+    "https://raw.githubusercontent.com/tensorflow/models/master/research/audioset/yamnet/yamnet_class_map.csv",
+    "https://storage.googleapis.com/audioset/yamnet_class_map.csv"
+)
 
-    # Create directory if it doesn't exist
-    if not os.path.exists(model_dir):
-        os.makedirs(model_dir, exist_ok=True)
-        logger.info(f"Created directory: {model_dir}")
 
-    # Check if labels file already exists
-    if os.path.exists(labels_file):
-        logger.info(f"YAMNet labels file already exists at {labels_file}")
+def _save_labels(url, response, labels_file):
+    """Convert a labels CSV response into the labels file.
+
+    Args:
+        url: URL the response came from
+        response: HTTP response, which is closed
+        labels_file: Path of the labels file to write
+
+    Returns:
+        True if the labels file is up to date, False otherwise
+    """
+    if response.status == 304:
+        response.close()
+        logger.info("YAMNet labels at %s are up to date", labels_file)
         return True
 
-    # URLs to try for the labels file
-    urls = [
-        "https://raw.githubusercontent.com/tensorflow/models/master/research/audioset/yamnet/yamnet_class_map.csv",
-        "https://storage.googleapis.com/audioset/yamnet_class_map.csv"
-    ]
+    # Convert to a temporary file so a failed download never leaves
+    # truncated labels behind
+    partial_file = labels_file + ".part"
+    try:
+        # Convert CSV to simple text format expected by YAMNet,
+        # streaming lines from the response as they arrive
+        lines = io.TextIOWrapper(response, encoding='utf-8', newline='')
+        with open(partial_file, 'w') as f:
+            reader = csv.reader(lines)
+            next(reader)  # Skip header line
+            f.write('\n'.join(row[2] for row in reader if row))
+        lines.detach()  # The response is closed below
+        os.replace(partial_file, labels_file)
+        save_validators(labels_file, response)
+
+        logger.info("YAMNet labels file created at %s", labels_file)
+        return True
 
-    for url in urls:
+    except Exception as e:
+        logger.warning("Failed to download from %s: %s", url, e)
         try:
-            logger.info(f"Trying to download labels from: {url}")
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
-            }
-            req = urllib.request.Request(url, headers=headers)
+            os.remove(partial_file)
+        except OSError:
+            pass
+        return False
+    finally:
+        response.close()
 
-            with urllib.request.urlopen(req) as response:
-                csv_content = response.read().decode('utf-8')
 
-                # Convert CSV to simple text format expected by YAMNet
-                lines = csv_content.strip().split('\n')[1:]  # Skip header line
-                labels = [line.split(',')[2].strip('"') for line in lines]
+def download_yamnet_labels(refresh=False):
+    """Download the YAMNet labels file if it doesn't exist.
 
-                with open(labels_file, 'w') as f:
-                    f.write('\n'.join(labels))
+    Args:
+        refresh: Re-check existing labels against the server, downloading
+            them again only if they have changed
+    """
+    model_dir = os.path.join("models", "yamnet_model")
+    labels_file = os.path.join(model_dir, "yamnet_labels.txt")
+
+    # Create directory if it doesn't exist
+    try:
+        Path(model_dir).mkdir(parents=True)
+        logger.info("Created directory: %s", model_dir)
+    except FileExistsError:
+        pass
 
-                logger.info(f"YAMNet labels file created at {labels_file}")
+    # Check if labels file already exists
+    if os.path.exists(labels_file) and not refresh:
+        logger.info("YAMNet labels file already exists at %s", labels_file)
+        return True
+
+    # Use the first mirror to respond, and if its labels fail to download,
+    # try the remaining mirrors in order
+    headers = conditional_headers(labels_file, HEADERS)
+    remaining = list(LABEL_URLS)
+    mirrors = remaining
+    while mirrors:
+        result = open_first_mirror(mirrors, headers)
+        if result is None:
+            failed = mirrors
+        else:
+            url, response = result
+            if _save_labels(url, response, labels_file):
                 return True
+            failed = [url]
 
-        except Exception as e:
-            logger.warning(f"Failed to download from {url}: {str(e)}")
+        remaining = [url for url in remaining if url not in failed]
+        mirrors = remaining[:1]
 
     logger.error("Failed to download YAMNet labels from all sources.")
 
+    # Keep labels from an earlier download when refreshing fails
+    if os.path.exists(labels_file):
+        logger.info("Keeping existing labels file at %s", labels_file)
+        return True
+
     # Create a simple fallback labels file with common sounds
     logger.info("Creating fallback labels file...")
     fallback_labels = [
@@ -77,4 +131,4 @@ def download_yamnet_labels():
 
 
 if __name__ == "__main__":
-    download_yamnet_labels()
\ No newline at end of file
+    download_yamnet_labels(refresh="--refresh" in sys.argv)
\ No newline at end of file
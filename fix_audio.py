@@ -1,21 +1,24 @@
 import os
-import json
-import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("AudioFixer")
+import config_cache
+import sensebridge_logging
 
+logger = sensebridge_logging.setup("AudioFixer")
 
-def fix_audio_config():
-    """Update audio configuration to work better with available hardware."""
+
+def fix_audio_config(flush=True):
+    """Update audio configuration to work better with available hardware.
+
+    Args:
+        flush: Write the updated configs immediately; pass False when
+            batching several fixers and call config_cache.flush() once
+    """
     device_config_file = os.path.join("config", "device_config.json")
     user_prefs_file = os.path.join("config", "user_prefs.json")
 
     # Update device configuration
     try:
-        with open(device_config_file, 'r') as f:
-            device_config = json.load(f)
+        device_config = config_cache.load(device_config_file)
 
         if "audio" not in device_config:
             device_config["audio"] = {}
@@ -28,17 +31,15 @@ def fix_audio_config():
         device_config["audio"]["retry_on_error"] = True
         device_config["audio"]["device_index"] = -1  # Auto-detect
 
-        with open(device_config_file, 'w') as f:
-            json.dump(device_config, f, indent=2)
+        config_cache.save(device_config_file, device_config)
 
-        logger.info(f"Updated audio configuration in {device_config_file}")
+        logger.info("Updated audio configuration in %s", device_config_file)
     except Exception as e:
-        logger.error(f"Error updating device configuration: {e}")
+        logger.error("Error updating device configuration: %s", e)
 
     # Update user preferences
     try:
-        with open(user_prefs_file, 'r') as f:
-            user_prefs = json.load(f)
+        user_prefs = config_cache.load(user_prefs_file)
 
         if "speech_to_text" not in user_prefs:
             user_prefs["speech_to_text"] = {}
@@ -50,12 +51,14 @@ def fix_audio_config():
         user_prefs["speech_to_text"]["pause_threshold"] = 0.5
         user_prefs["speech_to_text"]["phrase_threshold"] = 0.3
 
-        with open(user_prefs_file, 'w') as f:
-            json.dump(user_prefs, f, indent=2)
+        config_cache.save(user_prefs_file, user_prefs)
 
-        logger.info(f"Updated speech recognition settings in {user_prefs_file}")
+        logger.info("Updated speech recognition settings in %s", user_prefs_file)
     except Exception as e:
-        logger.error(f"Error updating user preferences: {e}")
+        logger.error("Error updating user preferences: %s", e)
+
+    if flush:
+        config_cache.flush()
 
 
 if __name__ == "__main__":
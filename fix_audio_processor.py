@@ -4,11 +4,100 @@ Fix the audio_processor.py to convert stereo to mono before sending to the model
 """
 
 import os
-import logging
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("AudioFixer")
+import ast
+
+import sensebridge_logging
+
+logger = sensebridge_logging.setup("AudioFixer")
+
+
+def _is_docstring(node):
+    """Check whether an AST statement is a docstring."""
+    return (isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str))
+
+
+def insert_function_prologue(content, function_name, code_lines, class_name=None):
+    """Insert statements at the start of a function body.
+
+    The function is located with the ast module instead of scanning lines,
+    so formatting, comments and decorators do not matter. The code is added
+    after any docstring, indented to match the existing body.
+
+    Args:
+        content: Python source code
+        function_name: Name of the function to modify
+        code_lines: Lines to insert, relative to the body indentation
+        class_name: Only look for the function inside this class
+
+    Returns:
+        Modified source code, or None if the function was not found
+    """
+    tree = ast.parse(content)
+
+    if class_name:
+        scope = next((node.body for node in tree.body
+                      if isinstance(node, ast.ClassDef) and node.name == class_name), [])
+    else:
+        scope = ast.walk(tree)
+
+    function = next((node for node in scope
+                     if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                     and node.name == function_name), None)
+    if function is None:
+        return None
+
+    lines = content.splitlines(keepends=True)
+    first = function.body[0]
+    if _is_docstring(first):
+        insert_at = first.end_lineno
+    else:
+        # Keep comments that lead the first statement attached to it
+        insert_at = first.lineno - 1
+        while insert_at > function.lineno and lines[insert_at - 1].strip()[:1] in ("", "#"):
+            insert_at -= 1
+
+    newline = "\r\n" if "\r\n" in content else "\n"
+    indentation = " " * first.col_offset
+    lines[insert_at:insert_at] = [f"{indentation}{line}{newline}" if line else newline
+                                  for line in code_lines]
+    return "".join(lines)
+
+
+def find_method_name(content, class_name, name_part):
+    """Find the first method of a class whose name contains a string.
+
+    Args:
+        content: Python source code
+        class_name: Name of the class to search
+        name_part: Substring of the method name, e.g. "process_audio"
+
+    Returns:
+        Name of the method, or None if the class has no such method
+    """
+    for node in ast.parse(content).body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            return next((item.name for item in node.body
+                         if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                         and name_part in item.name), None)
+    return None
+
+
+def add_numpy_import(content):
+    """Add 'import numpy as np' after the first import if numpy is not imported."""
+    tree = ast.parse(content)
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    for node in imports:
+        if isinstance(node, ast.Import) and any(alias.name == "numpy" for alias in node.names):
+            return content
+
+    if not imports:
+        return content
+
+    newline = "\r\n" if "\r\n" in content else "\n"
+    lines = content.splitlines(keepends=True)
+    lines.insert(imports[0].end_lineno, f"import numpy as np{newline}")
+    return "".join(lines)
 
 
 def fix_audio_processor():
@@ -16,69 +105,47 @@ def fix_audio_processor():
     audio_file = os.path.join("src", "audio", "audio_processor.py")
 
     if not os.path.exists(audio_file):
-        logger.error(f"Audio processor file not found: {audio_file}")
+        logger.error("Audio processor file not found: %s", audio_file)
         return False
 
     try:
         # Read the file content
-        with open(audio_file, 'r') as f:
+        with open(audio_file, 'r', newline='') as f:
             content = f.read()
 
         # Check if the conversion code is already there
         if "convert_to_mono" not in content:
-            # Get indentation level
-            lines = content.split("\n")
-            import_line = None
-            for line in lines:
-                if "import numpy" in line:
-                    import_line = line
-                    break
-
-            # If numpy is not imported, add it
-            if not import_line:
-                for i, line in enumerate(lines):
-                    if "import" in line:
-                        lines.insert(i + 1, "import numpy as np")
-                        break
-
-            # Add conversion function
-            for i, line in enumerate(lines):
-                if "class AudioProcessor" in line:
-                    for j in range(i + 1, len(lines)):
-                        if "def" in lines[j] and "process_audio" in lines[j]:
-                            # Get the indentation
-                            indentation = lines[j].split("def")[0]
-
-                            # Add conversion code after the function definition
-                            process_line = j + 1
-                            while process_line < len(lines) and not lines[process_line].strip():
-                                process_line += 1
-
-                            # Add the conversion code
-                            conversion_code = [
-                                f"{indentation}    # Convert stereo to mono if needed",
-                                f"{indentation}    if len(audio_data.shape) > 1 and audio_data.shape[1] > 1:",
-                                f"{indentation}        audio_data = np.mean(audio_data, axis=1)"
-                            ]
-
-                            for k, code_line in enumerate(conversion_code):
-                                lines.insert(process_line + k, code_line)
-
-                            break
-                    break
+            # Add conversion code at the start of the first method whose
+            # name contains "process_audio" (currently _preprocess_audio)
+            method_name = find_method_name(content, "AudioProcessor", "process_audio")
+            if method_name is None:
+                logger.warning("Could not find process_audio method in audio processor")
+                return False
+
+            content = add_numpy_import(content)
+            modified_content = insert_function_prologue(
+                content,
+                method_name,
+                [
+                    "# Convert stereo to mono if needed",
+                    "if len(audio_data.shape) > 1 and audio_data.shape[1] > 1:",
+                    "    audio_data = np.mean(audio_data, axis=1)"
+                ],
+                class_name="AudioProcessor"
+            )
 
             # Write the modified content back
-            with open(audio_file, 'w') as f:
-                f.write("\n".join(lines))
+            with open(audio_file, 'w', newline='') as f:
+                f.write(modified_content)
 
-            logger.info(f"Added stereo to mono conversion to {audio_file}")
+            logger.info("Added stereo to mono conversion to %s", audio_file)
             return True
         else:
             logger.info("Stereo to mono conversion already added")
             return True
 
     except Exception as e:
-        logger.error(f"Error fixing audio processor: {e}")
+        logger.error("Error fixing audio processor: %s", e)
         return False
 
 
@@ -1,32 +1,54 @@
 # fix_imports.py
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+# Common import fixes
+# Example: Change from ..integration.models.sound_classifier to ..models.sound_classifier
+IMPORT_FIXES = {
+    "..integration.models": "..models",
+    "..communication.gui": "..gui",
+    "..management.logger": "..utils.logger",
+    "src.with TF": "src",
+}
+IMPORT_PATTERN = re.compile("|".join(map(re.escape, IMPORT_FIXES)))
 
 
 def fix_imports_in_file(file_path):
-    with open(file_path, 'r') as file:
+    with open(file_path, 'r', newline='') as file:
         content = file.read()
 
-    # Fix common import patterns
-    # Example: Change from ..integration.models.sound_classifier to ..models.sound_classifier
-    content = content.replace("..integration.models", "..models")
-    content = content.replace("..communication.gui", "..gui")
-    content = content.replace("..management.logger", "..utils.logger")
-    content = content.replace("src.with TF", "src")
+    fixed = IMPORT_PATTERN.sub(lambda m: IMPORT_FIXES[m.group(0)], content)
+
+    # Skip the write entirely when nothing needed fixing
+    if fixed == content:
+        return
 
     # Write back the fixed content
-    with open(file_path, 'w') as file:
-        file.write(content)
+    with open(file_path, 'w', newline='') as file:
+        file.write(fixed)
     print(f"Fixed imports in {file_path}")
 
 
+def find_python_files(directory):
+    """Recursively yield paths of Python files under a directory."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Like os.walk, don't descend into symlinked directories
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_python_files(entry.path)
+            elif entry.name.endswith(".py") and not entry.is_dir():
+                yield entry.path
+
+
 def main():
-    # Walk through all Python files in src directory
-    for root, _, files in os.walk("src"):
-        for file in files:
-            if file.endswith(".py"):
-                fix_imports_in_file(os.path.join(root, file))
+    # Collect all Python files in src directory, then fix them concurrently;
+    # each file is an independent read-modify-write
+    file_paths = list(find_python_files("src"))
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(fix_imports_in_file, file_paths))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,19 +1,22 @@
 import os
-import logging
-import json
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("ModelFixer")
+import config_cache
+import sensebridge_logging
 
+logger = sensebridge_logging.setup("ModelFixer")
 
-def fix_sound_model_config():
-    """Update audio configuration to fix dimension mismatch."""
+
+def fix_sound_model_config(flush=True):
+    """Update audio configuration to fix dimension mismatch.
+
+    Args:
+        flush: Write the updated config immediately; pass False when
+            batching several fixers and call config_cache.flush() once
+    """
     device_config_file = os.path.join("config", "device_config.json")
 
     try:
-        with open(device_config_file, 'r') as f:
-            device_config = json.load(f)
+        device_config = config_cache.load(device_config_file)
 
         if "audio" not in device_config:
             device_config["audio"] = {}
@@ -24,12 +27,14 @@ def fix_sound_model_config():
         device_config["audio"]["sample_rate"] = 16000
         device_config["audio"]["model_sample_rate"] = 16000
 
-        with open(device_config_file, 'w') as f:
-            json.dump(device_config, f, indent=2)
+        config_cache.save(device_config_file, device_config)
 
-        logger.info(f"Updated audio configuration in {device_config_file}")
+        logger.info("Updated audio configuration in %s", device_config_file)
     except Exception as e:
-        logger.error(f"Error updating device configuration: {e}")
+        logger.error("Error updating device configuration: %s", e)
+
+    if flush:
+        config_cache.flush()
 
 
 if __name__ == "__main__":
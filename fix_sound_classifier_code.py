@@ -4,13 +4,11 @@ Fix the sound classifier to handle stereo audio by converting it to mono.
 """
 
 import os
-import logging
-import fileinput
-import sys
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("ModelFixer")
+from fix_audio_processor import insert_function_prologue
+import sensebridge_logging
+
+logger = sensebridge_logging.setup("ModelFixer")
 
 
 def fix_sound_classifier_code():
@@ -18,38 +16,39 @@ def fix_sound_classifier_code():
     classifier_file = os.path.join("src", "models", "sound_classifier.py")
 
     if not os.path.exists(classifier_file):
-        logger.error(f"Sound classifier file not found: {classifier_file}")
+        logger.error("Sound classifier file not found: %s", classifier_file)
         return False
 
     try:
         # Read the file content
-        with open(classifier_file, 'r') as f:
+        with open(classifier_file, 'r', newline='') as f:
             content = f.read()
 
         # Check if we need to add code to convert stereo to mono
         if "convert_to_mono" not in content:
-            # Find the process_audio method
-            if "def process_audio" in content:
-                # Add code to convert stereo to mono
-                modified_content = content.replace(
-                    "def process_audio(self, audio_data):",
-                    """def process_audio(self, audio_data):
-        # Convert stereo to mono if needed
-        if len(audio_data.shape) > 1 and audio_data.shape[1] == 2:
-            logging.debug("Converting stereo audio to mono")
-            audio_data = np.mean(audio_data, axis=1)
-
-        # Ensure audio data is the right shape for the model
-        if len(audio_data.shape) != 1:
-            logging.warning(f"Unexpected audio shape: {audio_data.shape}, reshaping")
-            audio_data = np.reshape(audio_data, -1)"""
-                )
+            # Add code to convert stereo to mono at the start of process_audio
+            modified_content = insert_function_prologue(
+                content,
+                "process_audio",
+                [
+                    "# Convert stereo to mono if needed",
+                    "if len(audio_data.shape) > 1 and audio_data.shape[1] == 2:",
+                    "    logging.debug(\"Converting stereo audio to mono\")",
+                    "    audio_data = np.mean(audio_data, axis=1)",
+                    "",
+                    "# Ensure audio data is the right shape for the model",
+                    "if len(audio_data.shape) != 1:",
+                    "    logging.warning(f\"Unexpected audio shape: {audio_data.shape}, reshaping\")",
+                    "    audio_data = np.reshape(audio_data, -1)"
+                ]
+            )
 
+            if modified_content is not None:
                 # Write the modified content back
-                with open(classifier_file, 'w') as f:
+                with open(classifier_file, 'w', newline='') as f:
                     f.write(modified_content)
 
-                logger.info(f"Added stereo to mono conversion to {classifier_file}")
+                logger.info("Added stereo to mono conversion to %s", classifier_file)
                 return True
             else:
                 logger.warning("Could not find process_audio method in sound classifier")
@@ -58,7 +57,7 @@ def fix_sound_classifier_code():
             return True
 
     except Exception as e:
-        logger.error(f"Error fixing sound classifier: {e}")
+        logger.error("Error fixing sound classifier: %s", e)
         return False
 
 
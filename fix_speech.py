@@ -1,19 +1,22 @@
 import os
-import json
-import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("SpeechFixer")
+import config_cache
+import sensebridge_logging
 
+logger = sensebridge_logging.setup("SpeechFixer")
 
-def fix_speech_config():
-    """Update speech recognition configuration to be more sensitive."""
+
+def fix_speech_config(flush=True):
+    """Update speech recognition configuration to be more sensitive.
+
+    Args:
+        flush: Write the updated config immediately; pass False when
+            batching several fixers and call config_cache.flush() once
+    """
     user_prefs_file = os.path.join("config", "user_prefs.json")
 
     try:
-        with open(user_prefs_file, 'r') as f:
-            user_prefs = json.load(f)
+        user_prefs = config_cache.load(user_prefs_file)
 
         if "speech_to_text" not in user_prefs:
             user_prefs["speech_to_text"] = {}
@@ -28,12 +31,14 @@ def fix_speech_config():
         user_prefs["speech_to_text"]["timeout"] = 10  # Longer timeout
         user_prefs["speech_to_text"]["phrase_time_limit"] = 10  # Longer phrase time
 
-        with open(user_prefs_file, 'w') as f:
-            json.dump(user_prefs, f, indent=2)
+        config_cache.save(user_prefs_file, user_prefs)
 
-        logger.info(f"Updated speech recognition settings in {user_prefs_file}")
+        logger.info("Updated speech recognition settings in %s", user_prefs_file)
     except Exception as e:
-        logger.error(f"Error updating user preferences: {e}")
+        logger.error("Error updating user preferences: %s", e)
+
+    if flush:
+        config_cache.flush()
 
 
 if __name__ == "__main__":
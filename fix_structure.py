@@ -1,12 +1,15 @@
 # fix_structure.py
 import os
 import shutil
+from pathlib import Path
 
 
 def create_directory(path):
-    if not os.path.exists(path):
-        os.makedirs(path)
+    try:
+        Path(path).mkdir(parents=True)
         print(f"Created directory: {path}")
+    except FileExistsError:
+        pass
 
 
 def main():
@@ -31,22 +34,33 @@ def main():
 
     # Move files from duplicate directories to the correct location
     # Example: Move files from src/communication/gui to src/gui if needed
-    if os.path.exists("src/communication/gui"):
-        for file in os.listdir("src/communication/gui"):
-            src_path = os.path.join("src/communication/gui", file)
-            dst_path = os.path.join("src/gui", file)
-            if os.path.isfile(src_path) and not os.path.exists(dst_path):
-                shutil.copy2(src_path, dst_path)
-                print(f"Copied {src_path} to {dst_path}")
+    try:
+        entries = list(os.scandir("src/communication/gui"))
+    except FileNotFoundError:
+        entries = []
+
+    for entry in entries:
+        dst_path = os.path.join("src/gui", entry.name)
+        if entry.is_file() and not os.path.exists(dst_path):
+            try:
+                # Same filesystem: a rename moves the file without copying data
+                os.replace(entry.path, dst_path)
+                print(f"Moved {entry.path} to {dst_path}")
+            except OSError:
+                shutil.copy2(entry.path, dst_path)
+                print(f"Copied {entry.path} to {dst_path}")
 
     # Similar for other duplicate/misplaced directories
 
     # Create missing __init__.py files
-    for directory in directories:
-        init_file = os.path.join(directory, "__init__.py")
-        if not os.path.exists(init_file):
-            open(init_file, 'a').close()
+    init_files = [os.path.join(directory, "__init__.py") for directory in directories]
+    for init_file in init_files:
+        # touch(exist_ok=False) is a single O_CREAT|O_EXCL open, no stat needed
+        try:
+            Path(init_file).touch(exist_ok=False)
             print(f"Created {init_file}")
+        except FileExistsError:
+            pass
 
 
 if __name__ == "__main__":
@@ -5,19 +5,22 @@ import os
 import sys
 import subprocess
 import argparse
-import logging
+import importlib
 import time
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger("SenseBridge")
+import sensebridge_logging
+
+logger = sensebridge_logging.setup("SenseBridge")
+
+
+def _scan_directory(path):
+    """List a directory's entries by name, or an empty dict if it doesn't exist."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
 
 
 def check_environment():
@@ -29,11 +32,12 @@ def check_environment():
         return False
 
     # Check for required directories
+    root_entries = _scan_directory(".")
     required_dirs = ["src", "config", "models"]
-    for directory in required_dirs:
-        if not os.path.exists(directory):
-            logger.error(f"Required directory '{directory}' not found.")
-            return False
+    missing_dirs = [directory for directory in required_dirs
+                    if directory not in root_entries or not root_entries[directory].is_dir()]
+    for directory in missing_dirs:
+        logger.error("Required directory '%s' not found.", directory)
 
     # Check for virtual environment
     if not hasattr(sys, 'real_prefix') and not (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
@@ -41,16 +45,19 @@ def check_environment():
         logger.warning("Try running: source .venv/bin/activate")
 
     # Check for configuration files
-    config_files = ["config/device_config.json", "config/sound_events.json", "config/user_prefs.json"]
-    for config_file in config_files:
-        if not os.path.exists(config_file):
-            logger.error(f"Required configuration file '{config_file}' not found.")
-            return False
+    config_entries = _scan_directory("config")
+    config_files = ["device_config.json", "sound_events.json", "user_prefs.json"]
+    missing_configs = [name for name in config_files if name not in config_entries]
+    for name in missing_configs:
+        logger.error("Required configuration file '%s' not found.", os.path.join("config", name))
+
+    if missing_dirs or missing_configs:
+        return False
 
     # Check for YAMNet model
     model_file = "models/yamnet_model/yamnet.tflite"
-    if not os.path.exists(model_file):
-        logger.warning(f"YAMNet model file '{model_file}' not found. Will use fallback classification.")
+    if "yamnet.tflite" not in _scan_directory(os.path.dirname(model_file)):
+        logger.warning("YAMNet model file '%s' not found. Will use fallback classification.", model_file)
 
     return True
 
@@ -72,21 +79,21 @@ def setup_environment():
             subprocess.run(["chmod", "+x", setup_script])
 
         # Run the setup script
-        logger.info(f"Running setup script {setup_script}...")
+        logger.info("Running setup script %s...", setup_script)
         if os.name == 'nt':
             result = subprocess.run([setup_script], capture_output=True, text=True, shell=True)
         else:
             result = subprocess.run([f"./{setup_script}"], capture_output=True, text=True)
 
         if result.returncode != 0:
-            logger.error(f"Setup script failed with error code {result.returncode}")
+            logger.error("Setup script failed with error code %s", result.returncode)
             logger.error(result.stderr)
             return False
 
         logger.info("Setup script completed successfully.")
         return True
     else:
-        logger.error(f"Setup script ({setup_script}) not found.")
+        logger.error("Setup script (%s) not found.", setup_script)
         return False
 
 
@@ -97,7 +104,7 @@ def create_directory_structure():
     # Create required directories
     directories = ["src", "config", "models/yamnet_model", "logs"]
     for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+        Path(directory).mkdir(parents=True, exist_ok=True)
 
     logger.info("Directory structure created.")
     return True
@@ -125,13 +132,13 @@ def run_sensebridge(args):
             command.append(f"--timeout={args.timeout}")
 
         # Run SenseBridge
-        logger.info(f"Running SenseBridge with command: {' '.join(command)}")
+        logger.info("Running SenseBridge with command: %s", ' '.join(command))
         process = subprocess.run(command)
 
         return process.returncode == 0
 
     except Exception as e:
-        logger.error(f"Error running SenseBridge: {e}")
+        logger.error("Error running SenseBridge: %s", e)
         return False
 
 
@@ -159,46 +166,84 @@ def run_tests(args):
                 command.append("--gui")
 
         # Run tests
-        logger.info(f"Running tests with command: {' '.join(command)}")
+        logger.info("Running tests with command: %s", ' '.join(command))
         process = subprocess.run(command)
 
         return process.returncode == 0
 
     except Exception as e:
-        logger.error(f"Error running tests: {e}")
+        logger.error("Error running tests: %s", e)
         return False
 
 
+def run_fix_script(module_name):
+    """Run a fix script's main() in-process.
+
+    Falls back to running the script in a subprocess if it cannot be imported.
+
+    Args:
+        module_name: Name of the script module (without .py)
+
+    Returns:
+        True if the script exists and was run, False otherwise
+    """
+    script = f"{module_name}.py"
+    try:
+        # The import system lists the directory once and caches it, so a
+        # missing script costs no extra stat calls
+        module = importlib.import_module(module_name)
+    except Exception as e:
+        if isinstance(e, ModuleNotFoundError) and e.name == module_name:
+            return False
+        logger.warning("Could not import %s (%s), running it in a subprocess", script, e)
+        subprocess.run([sys.executable, script])
+        return True
+
+    logger.info("Running %s...", script)
+    try:
+        module.main()
+    except Exception as e:
+        logger.error("Error running %s: %s", script, e)
+
+    return True
+
+
+def fix_configuration():
+    """Apply the audio, sound model and speech config fixes.
+
+    The fixers share one config cache, so each config file is parsed and
+    written once however many fixers change it.
+
+    Returns:
+        True if the fixed configs were written, False otherwise
+    """
+    try:
+        import config_cache
+        from fix_audio import fix_audio_config
+        from fix_model import fix_sound_model_config
+        from fix_speech import fix_speech_config
+    except ImportError as e:
+        logger.warning("Could not load the config fixers: %s", e)
+        return False
+
+    logger.info("Fixing configuration...")
+    fix_audio_config(flush=False)
+    fix_sound_model_config(flush=False)
+    fix_speech_config(flush=False)
+    return config_cache.flush()
+
+
 def fix_project_structure():
     """Fix the project structure by creating necessary files and directories."""
     logger.info("Fixing project structure...")
 
-    # Check for fix_structure.py
-    if os.path.exists("fix_structure.py"):
-        # Run fix_structure.py
-        logger.info("Running fix_structure.py...")
-        subprocess.run([sys.executable, "fix_structure.py"])
-    else:
-        # Create basic directory structure
+    # Run fix_structure.py, or create the basic directory structure without it
+    if not run_fix_script("fix_structure"):
         create_directory_structure()
 
-    # Check for fix_imports.py
-    if os.path.exists("fix_imports.py"):
-        # Run fix_imports.py
-        logger.info("Running fix_imports.py...")
-        subprocess.run([sys.executable, "fix_imports.py"])
-
-    # Check for create_init_files.py
-    if os.path.exists("create_init_files.py"):
-        # Run create_init_files.py
-        logger.info("Running create_init_files.py...")
-        subprocess.run([sys.executable, "create_init_files.py"])
-
-    # Check for create_config_files.py
-    if os.path.exists("create_config_files.py"):
-        # Run create_config_files.py
-        logger.info("Running create_config_files.py...")
-        subprocess.run([sys.executable, "create_config_files.py"])
+    run_fix_script("fix_imports")
+    run_fix_script("create_init_files")
+    run_fix_script("create_config_files")
 
     logger.info("Project structure fixed.")
     return True
@@ -217,6 +262,10 @@ def main():
     # Fix command
     fix_parser = subparsers.add_parser("fix", help="Fix the project structure")
 
+    # Fix config command
+    fix_config_parser = subparsers.add_parser(
+        "fix-config", help="Apply the audio, sound model and speech config fixes")
+
     # Run command
     run_parser = subparsers.add_parser("run", help="Run the SenseBridge application")
     run_parser.add_argument("--headless", action="store_true", help="Run in headless mode (no GUI)")
@@ -258,6 +307,14 @@ def main():
             logger.error("Failed to fix project structure.")
             return 1
 
+    elif args.command == "fix-config":
+        if fix_configuration():
+            logger.info("Configuration fixed successfully.")
+            return 0
+        else:
+            logger.error("Failed to fix configuration.")
+            return 1
+
     elif args.command == "run":
         # Check environment before running
         if not check_environment():
@@ -0,0 +1,23 @@
+# sensebridge_logging.py
+import logging
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def setup(name, level=logging.INFO):
+    """Configure console logging for the SenseBridge scripts and get a logger.
+
+    Logging is configured only once per process, so scripts that import
+    each other (or are run in-process by run_sensebridge.py) share a single
+    handler and formatter.
+
+    Args:
+        name: Name of the logger to return
+        level: Log level, used only when logging isn't configured yet
+
+    Returns:
+        The named logger
+    """
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=level, format=LOG_FORMAT, handlers=[logging.StreamHandler()])
+    return logging.getLogger(name)
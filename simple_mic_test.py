@@ -6,11 +6,32 @@ Simple microphone test focusing only on the default microphone.
 import speech_recognition as sr
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("SimpleMicTest")
 
+# How long to keep listening for phrases (seconds)
+TEST_DURATION = 10
+
+
+def recognize_phrase(recognizer, audio):
+    """Recognize one captured phrase.
+
+    Args:
+        recognizer: Recognizer that captured the phrase
+        audio: Captured audio data
+    """
+    logger.info("Got audio, recognizing...")
+    try:
+        text = recognizer.recognize_google(audio)
+        logger.info(f"Recognized: {text}")
+    except sr.UnknownValueError:
+        logger.info("Could not understand audio")
+    except sr.RequestError as e:
+        logger.error(f"Google Speech API error: {e}")
+
 
 def test_default_microphone():
     """Test only the default microphone."""
@@ -24,28 +45,24 @@ def test_default_microphone():
         logger.info("Testing default microphone")
         try:
             # Use the default microphone
-            with sr.Microphone() as source:
+            microphone = sr.Microphone()
+            with microphone as source:
                 logger.info("Successfully opened default microphone")
                 logger.info("Adjusting for ambient noise...")
                 r.adjust_for_ambient_noise(source, duration=2)
                 logger.info(f"Energy threshold set to {r.energy_threshold}")
 
-                logger.info("Say something!")
-                try:
-                    # Listen for 5 seconds
-                    audio = r.listen(source, timeout=5, phrase_time_limit=5)
-                    logger.info("Got audio, recognizing...")
-
-                    try:
-                        text = r.recognize_google(audio)
-                        logger.info(f"Recognized: {text}")
-                    except sr.UnknownValueError:
-                        logger.info("Could not understand audio")
-                    except sr.RequestError as e:
-                        logger.error(f"Google Speech API error: {e}")
-
-                except sr.WaitTimeoutError:
-                    logger.warning("Listening timed out")
+            # Record in the background and recognize each phrase on a worker
+            # thread, so recording continues while a phrase is being recognized
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                logger.info(f"Say something! Listening for {TEST_DURATION} seconds")
+                stop_listening = r.listen_in_background(
+                    microphone,
+                    lambda recognizer, audio: executor.submit(recognize_phrase, recognizer, audio),
+                    phrase_time_limit=5
+                )
+                time.sleep(TEST_DURATION)
+                stop_listening(wait_for_stop=True)
 
             logger.info("Microphone test completed")
 
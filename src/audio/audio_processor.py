@@ -7,7 +7,7 @@ import numpy as np
 import pyaudio
 import time
 import threading
-import queue
+from collections import deque
 from scipy import signal
 import logging
 from ..utils.config import Config
@@ -18,8 +18,16 @@ logger = logging.getLogger(__name__)
 class AudioProcessor:
     """Handles audio capture and preprocessing for sound recognition."""
 
-    def __init__(self):
-        """Initialize the audio processor with configuration settings."""
+    def __init__(self, max_buffer_seconds=None, pyaudio_instance=None):
+        """Initialize the audio processor with configuration settings.
+
+        Args:
+            max_buffer_seconds: Maximum audio to keep queued for consumers;
+                the oldest chunks are dropped beyond it (None for no limit)
+            pyaudio_instance: Shared PyAudio instance to open the stream on;
+                the caller stays responsible for terminating it. If None, the
+                processor creates and terminates its own.
+        """
         self.config = Config().get_device_config()
         self.audio_config = self.config["audio"]
 
@@ -27,10 +35,17 @@ class AudioProcessor:
         self.chunk_size = self.audio_config["chunk_size"]
         self.channels = self.audio_config["channels"]
 
-        self.audio_queue = queue.Queue()
+        # Queue of processed chunks, keeping only the most recent
+        # max_buffer_seconds of audio if the consumer falls behind
+        max_chunks = None
+        if max_buffer_seconds:
+            max_chunks = max(1, int(max_buffer_seconds * self.sample_rate / self.chunk_size))
+        self.audio_queue = deque(maxlen=max_chunks)
+        self.audio_available = threading.Condition()
         self.running = False
         self.audio_thread = None
-        self.pyaudio_instance = None
+        self.pyaudio_instance = pyaudio_instance
+        self._owns_pyaudio = pyaudio_instance is None
         self.stream = None
 
         logger.info("AudioProcessor initialized with sample rate: %d Hz", self.sample_rate)
@@ -60,15 +75,17 @@ class AudioProcessor:
             self.stream.stop_stream()
             self.stream.close()
 
-        if self.pyaudio_instance:
+        if self.pyaudio_instance and self._owns_pyaudio:
             self.pyaudio_instance.terminate()
+            self.pyaudio_instance = None
 
         logger.info("Audio processor stopped")
 
     def _audio_capture_loop(self):
         """Main audio capture loop that runs in a separate thread."""
         try:
-            self.pyaudio_instance = pyaudio.PyAudio()
+            if self.pyaudio_instance is None:
+                self.pyaudio_instance = pyaudio.PyAudio()
             self.stream = self.pyaudio_instance.open(
                 format=pyaudio.paInt16,
                 channels=self.channels,
@@ -100,7 +117,9 @@ class AudioProcessor:
         processed_data = self._preprocess_audio(audio_data)
 
         # Put processed data in queue
-        self.audio_queue.put(processed_data)
+        with self.audio_available:
+            self.audio_queue.append(processed_data)
+            self.audio_available.notify()
 
         return (in_data, pyaudio.paContinue)
 
@@ -126,7 +145,7 @@ class AudioProcessor:
         Returns:
             Processed audio data or None if timeout
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
\ No newline at end of file
+        with self.audio_available:
+            if not self.audio_available.wait_for(lambda: self.audio_queue, timeout):
+                return None
+            return self.audio_queue.popleft()
\ No newline at end of file
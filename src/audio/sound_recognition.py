@@ -17,11 +17,15 @@ logger = logging.getLogger(__name__)
 class SoundRecognition:
     """Detects and analyzes environmental sounds."""
 
-    def __init__(self, callback=None):
+    def __init__(self, callback=None, max_buffer_seconds=None, pyaudio_instance=None):
         """Initialize the sound recognition system.
 
         Args:
             callback: Function to call when a sound is detected
+            max_buffer_seconds: Maximum audio to buffer while recognition is
+                behind; older audio is dropped (None for no limit)
+            pyaudio_instance: Shared PyAudio instance for audio capture (see
+                AudioProcessor)
         """
         self.config = Config()
         self.user_prefs = self.config.get_user_preferences()
@@ -31,7 +35,8 @@ class SoundRecognition:
         self.min_confidence = self.sound_config["min_confidence"]
         self.ambient_adjustment = self.sound_config["ambient_adjustment"]
 
-        self.audio_processor = AudioProcessor()
+        self.audio_processor = AudioProcessor(max_buffer_seconds=max_buffer_seconds,
+                                              pyaudio_instance=pyaudio_instance)
         self.sound_classifier = SoundClassifier()
 
         self.callback = callback
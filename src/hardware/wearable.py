@@ -5,9 +5,13 @@ Manages communication with Bluetooth wearable devices.
 """
 
 import logging
+import selectors
+import socket
 import threading
-import time
 import json
+import struct
+from collections import OrderedDict
+from contextlib import suppress
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +27,49 @@ except ImportError:
         # Define a None value for bluetooth to avoid "not defined" errors
         bluetooth = None
 
+# MessagePack is optional; without it commands are sent as JSON lines
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# orjson is optional and only used to speed up JSON encoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..utils.config import Config
 
+# Big-endian length prefix for MessagePack frames
+_FRAME_HEADER = struct.Struct(">H")
+
+# Number of encoded command frames to keep for reuse
+FRAME_CACHE_SIZE = 64
+
+# Parameter value types whose encoded frames can be cached
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+
+# Size of the reusable receive buffer (fits the largest MessagePack frame)
+RECEIVE_BUFFER_SIZE = 65536
+
+
+def _dumps(obj):
+    """Encode an object as compact JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. non-string keys, which json converts
+    return json.dumps(obj, separators=(",", ":")).encode()
+
 
 class WearableDevice:
     """Manages communication with a Bluetooth wearable device."""
 
+    # Pre-encoded '{"cmd":<name>,"params":' JSON prefixes, by command name
+    _prefix_cache = {}
+
     def __init__(self):
         """Initialize the wearable device manager."""
         self.config = Config()
@@ -39,14 +80,38 @@ class WearableDevice:
         self.device_name = self.bluetooth_config["device_name"]
         self.wearable_mac = self.bluetooth_config.get("wearable_mac", "")
 
+        # Wire format: "json" (newline-delimited) or "msgpack" (length-prefixed)
+        self.wire_format = self.bluetooth_config.get("wire_format", "json")
+        if self.wire_format == "msgpack" and msgpack is None:
+            logger.warning("msgpack not installed, using JSON wire format")
+            self.wire_format = "json"
+
+        # The hello message never changes, so encode it once
+        self._hello_frame = self._encode("hello", {"name": self.device_name})
+
+        # Encoded frames of recently sent commands, in LRU order
+        self._frame_cache = OrderedDict()
+        self._frame_cache_lock = threading.Lock()
+
         # Connection status
         self.connected = False
         self.socket = None
 
+        # Receive buffer reused for every read from the wearable (only the
+        # connection thread reads, so it is never shared)
+        self._rx_buffer = bytearray(RECEIVE_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buffer)
+
         # Thread for connection maintenance
         self.connection_thread = None
         self.running = False
 
+        # Selector the connection thread waits on for incoming data, with a
+        # socket pair that stop() writes to in order to wake it up
+        self._selector = None
+        self._wakeup_reader = None
+        self._wakeup_writer = None
+
         logger.info("WearableDevice initialized")
 
     def start(self):
@@ -60,8 +125,19 @@ class WearableDevice:
             self.running = True
             return
 
+        # Without a MAC address there is nothing to connect to, so don't
+        # start a connection thread that would retry forever
+        if not self.wearable_mac:
+            logger.info("No wearable MAC address configured, wearable disabled")
+            self.running = True
+            return
+
         self.running = True
 
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._selector.register(self._wakeup_reader, selectors.EVENT_READ)
+
         # Start connection thread
         self.connection_thread = threading.Thread(target=self._connection_loop)
         self.connection_thread.daemon = True
@@ -76,16 +152,22 @@ class WearableDevice:
 
         self.running = False
 
-        if self.socket:
-            try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
+        if self._wakeup_writer:
+            self._wakeup_writer.send(b"\0")
 
         if self.connection_thread:
             self.connection_thread.join(timeout=2.0)
 
+        self._close_socket()
+
+        if self._selector:
+            self._selector.close()
+            self._wakeup_reader.close()
+            self._wakeup_writer.close()
+            self._selector = None
+            self._wakeup_reader = None
+            self._wakeup_writer = None
+
         logger.info("Wearable device manager stopped")
 
     def send_command(self, command, params=None):
@@ -103,21 +185,103 @@ class WearableDevice:
             return False
 
         try:
-            # Create command JSON
-            cmd_data = {
-                "cmd": command,
-                "params": params or {}
-            }
-
-            # Send command
-            self.socket.send(json.dumps(cmd_data).encode() + b"\n")
+            self.socket.sendall(self._get_frame(command, params))
             return True
 
         except Exception as e:
             logger.error(f"Error sending command to wearable: {str(e)}")
-            self.connected = False
+            self._close_socket()
             return False
 
+    def _encode(self, command, params=None):
+        """Encode a command as a frame in the configured wire format.
+
+        Args:
+            command: Command name
+            params: Command parameters
+
+        Returns:
+            Encoded frame bytes
+        """
+        if self.wire_format == "msgpack":
+            payload = msgpack.packb({"cmd": command, "params": params or {}}, use_bin_type=True)
+            return _FRAME_HEADER.pack(len(payload)) + payload
+
+        prefix = self._prefix_cache.get(command)
+        if prefix is None:
+            prefix = b'{"cmd":' + _dumps(command) + b',"params":'
+            self._prefix_cache[command] = prefix
+        return prefix + _dumps(params or {}) + b"}\n"
+
+    def _get_frame(self, command, params=None):
+        """Get the encoded frame for a command, reusing cached frames.
+
+        Only commands whose parameters are all scalars are cached. The key
+        includes each key's and value's type, as True, 1 and 1.0 compare
+        equal but encode differently. Other commands are encoded every time.
+
+        Args:
+            command: Command name
+            params: Command parameters
+
+        Returns:
+            Encoded frame bytes
+        """
+        items = (params or {}).items()
+        if not all(type(value) in _CACHEABLE_TYPES for _, value in items):
+            return self._encode(command, params)
+        key = (command, tuple((type(name), name, type(value), value) for name, value in items))
+
+        with self._frame_cache_lock:
+            frame = self._frame_cache.get(key)
+            if frame is not None:
+                self._frame_cache.move_to_end(key)
+                return frame
+
+        frame = self._encode(command, params)
+        with self._frame_cache_lock:
+            self._frame_cache[key] = frame
+            if len(self._frame_cache) > FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        return frame
+
+    def _recv_into_buffer(self, size, offset=0):
+        """Receive up to size bytes into the receive buffer at offset.
+
+        Returns:
+            Number of bytes received (0 if the connection was closed)
+        """
+        view = self._rx_view[offset:offset + size]
+        recv_into = getattr(self.socket, "recv_into", None)
+        if recv_into is not None:
+            return recv_into(view, size)
+
+        # Sockets without recv_into (e.g. the mock) still allocate
+        data = self.socket.recv(size)
+        view[:len(data)] = data
+        return len(data)
+
+    def _recv_exact(self, size):
+        """Receive exactly size bytes from the socket.
+
+        Returns:
+            View of the received bytes, valid until the next receive
+        """
+        received = 0
+        while received < size:
+            count = self._recv_into_buffer(size - received, received)
+            if not count:
+                raise ConnectionError("Wearable closed the connection")
+            received += count
+        return self._rx_view[:size]
+
+    def _read_response(self):
+        """Read one response from the wearable in the configured wire format."""
+        if self.wire_format == "msgpack":
+            length, = _FRAME_HEADER.unpack(self._recv_exact(_FRAME_HEADER.size))
+            return msgpack.unpackb(self._recv_exact(length), raw=False)
+        return self._rx_view[:self._recv_into_buffer(1024)]
+
     def _connection_loop(self):
         """Main connection maintenance loop."""
         while self.running:
@@ -125,13 +289,58 @@ class WearableDevice:
                 if not self.connected:
                     self._connect()
 
-                # Sleep to avoid busy waiting
-                time.sleep(5.0)
+                # Wait for data from the wearable, a disconnect or stop(),
+                # checking the connection at least every 5 seconds
+                self._wait_for_events(5.0)
 
             except Exception as e:
+                # stop() may have closed the selector while we were waiting
+                if not self.running:
+                    break
                 logger.error(f"Error in wearable connection loop: {str(e)}")
-                self.connected = False
-                time.sleep(10.0)  # Wait longer on error
+                self._close_socket()
+                self._wait_for_events(10.0)  # Wait longer on error
+
+    def _wait_for_events(self, timeout):
+        """Wait for socket events and handle them.
+
+        Args:
+            timeout: Maximum time to wait (seconds)
+        """
+        selector = self._selector
+        if selector is None or not self.running:
+            return
+
+        try:
+            events = selector.select(timeout)
+        except (OSError, ValueError):
+            if self.running:
+                raise
+            return  # stop() closed the selector
+
+        for key, _ in events:
+            if key.fileobj is self._wakeup_reader:
+                self._wakeup_reader.recv(64)
+            elif key.fileobj is self.socket:
+                count = self._recv_into_buffer(1024)
+                if not count:
+                    logger.warning("Wearable device disconnected")
+                    self._close_socket()
+                elif logger.isEnabledFor(logging.INFO):
+                    # Only copy the data out of the buffer if it is logged
+                    logger.info("Wearable message: %r", bytes(self._rx_view[:count]))
+
+    def _close_socket(self):
+        """Close the wearable socket and stop watching it."""
+        self.connected = False
+        if not self.socket:
+            return
+
+        with suppress(AttributeError, KeyError, ValueError):
+            self._selector.unregister(self.socket)
+        with suppress(OSError):
+            self.socket.close()
+        self.socket = None
 
     def _connect(self):
         """Connect to the wearable device."""
@@ -148,27 +357,28 @@ class WearableDevice:
             self.socket.settimeout(5.0)
 
             # Send hello message
-            hello_msg = {"cmd": "hello", "params": {"name": "SenseBridge"}}
-            self.socket.send(json.dumps(hello_msg).encode() + b"\n")
+            self.socket.sendall(self._hello_frame)
 
             # Wait for response
             try:
-                response = self.socket.recv(1024)
-                logger.info(f"Wearable response: {response}")
+                response = self._read_response()
+                if logger.isEnabledFor(logging.INFO):
+                    if isinstance(response, memoryview):
+                        response = bytes(response)
+                    logger.info("Wearable response: %s", response)
             except:
                 pass
 
+            # Watch for incoming data and disconnects (sockets without a
+            # file descriptor, like the mock, are only polled)
+            if hasattr(self.socket, "fileno"):
+                self._selector.register(self.socket, selectors.EVENT_READ)
+
             self.connected = True
             logger.info("Connected to wearable device")
             return True
 
         except Exception as e:
             logger.error(f"Error connecting to wearable: {str(e)}")
-            if self.socket:
-                try:
-                    self.socket.close()
-                except:
-                    pass
-                self.socket = None
-            self.connected = False
+            self._close_socket()
             return False
\ No newline at end of file
@@ -6,30 +6,21 @@ Initializes and coordinates all system components.
 import logging
 import threading
 import time
+import queue
 import os
 import signal
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from .utils.logger import setup_logging
 from .utils.config import Config
 from .utils.hardware_detection import get_hardware_detector
-from .audio.sound_recognition import SoundRecognition
-from .speech.speech_to_text import SpeechToText
 from .notification.notification_manager import NotificationManager
 from .hardware.device_control import DeviceController
 from .hardware.wearable import WearableDevice
-from .gui.app import create_app
 
-# Conditionally import simulator
-try:
-    from .simulator.simulator_ui import SimulatorUI
-
-    SIMULATOR_AVAILABLE = True
-except ImportError:
-    SIMULATOR_AVAILABLE = False
-
-# Global flag to signal program exit
-running = True
+# Repeats of the same sound within this window are merged into one event (seconds)
+SOUND_EVENT_COALESCE_WINDOW = 0.1
 
 
 class SenseBridge:
@@ -48,7 +39,7 @@ class SenseBridge:
 
         # Check hardware capabilities
         self.hardware = get_hardware_detector()
-        self.logger.info(f"Hardware capabilities: {self.hardware.get_capabilities()}")
+        self.logger.info("Hardware capabilities: %s", self.hardware.get_checked_capabilities())
 
         # If no display and not headless, switch to headless mode
         if not self.hardware.has_display and not headless:
@@ -64,6 +55,14 @@ class SenseBridge:
 
         # Load configuration
         self.config = Config()
+        self.audio_config = self.config.get_device_config().get("audio", {})
+
+        # Set to signal program exit
+        self._shutdown = threading.Event()
+
+        # Detected sounds waiting to be dispatched by the sound event thread
+        self._sound_events = queue.Queue()
+        self._sound_event_thread = None
 
         # Initialize components
         self.notification_manager = None
@@ -90,7 +89,11 @@ class SenseBridge:
             raise
 
     def _initialize_components(self):
-        """Initialize all system components."""
+        """Initialize all system components.
+
+        The audio, GUI and simulator modules pull in heavy dependencies, so
+        they are only imported when the component is actually used.
+        """
         # Initialize device controller first
         self.device_controller = DeviceController()
 
@@ -101,57 +104,73 @@ class SenseBridge:
         self.wearable = WearableDevice()
 
         # Initialize speech-to-text if audio is available
+        self.speech_to_text = None
         if self.hardware.has_audio:
-            self.speech_to_text = SpeechToText(text_callback=self.on_speech_recognized)
+            try:
+                from .speech.speech_to_text import SpeechToText
+                self.speech_to_text = SpeechToText(
+                    text_callback=self.on_speech_recognized,
+                    max_buffer_seconds=self.audio_config.get("max_buffer_seconds", 10)
+                )
+            except ImportError as e:
+                self.logger.warning(f"Speech-to-text dependencies missing ({e}), speech-to-text disabled")
         else:
             self.logger.warning("Audio not available, speech-to-text disabled")
-            self.speech_to_text = None
 
         # Initialize sound recognition if audio is available
+        self.sound_recognition = None
         if self.hardware.has_audio:
-            self.sound_recognition = SoundRecognition(callback=self.on_sound_detected)
+            try:
+                from .audio.sound_recognition import SoundRecognition
+                self.sound_recognition = SoundRecognition(
+                    callback=self.on_sound_detected,
+                    max_buffer_seconds=self.audio_config.get("max_buffer_seconds", 10)
+                )
+            except ImportError as e:
+                self.logger.warning(f"Sound recognition dependencies missing ({e}), sound recognition disabled")
         else:
             self.logger.warning("Audio not available, sound recognition disabled")
-            self.sound_recognition = None
 
         # Create GUI app
+        from .gui.app import create_app
         self.app = create_app(use_gui=not self.headless)
 
         # Create simulator if in simulation mode
-        if self.simulation and SIMULATOR_AVAILABLE:
-            self.simulator = SimulatorUI(
-                sound_callback=self.on_sound_detected,
-                button_callback=self.on_button_press
-            )
-            self.logger.info("Simulator UI created")
-        else:
-            self.simulator = None
+        self.simulator = None
+        if self.simulation:
+            try:
+                from .simulator.simulator_ui import SimulatorUI
+                self.simulator = SimulatorUI(
+                    sound_callback=self.on_sound_detected,
+                    button_callback=self.on_button_press
+                )
+                self.logger.info("Simulator UI created")
+            except ImportError:
+                self.logger.warning("Simulator not available")
 
     def start(self):
         """Start all SenseBridge components."""
         self.logger.info("Starting SenseBridge...")
 
         try:
-            # Start notification system first
+            # Start notification system first, the other components notify through it
             self.notification_manager.start()
 
-            # Start wearable device
-            self.wearable.start()
+            # Start dispatching detected sounds
+            self._sound_event_thread = threading.Thread(target=self._sound_event_loop, daemon=True)
+            self._sound_event_thread.start()
 
             # Register button callback
             self.device_controller.set_button_callback(self.on_button_press)
 
-            # Start speech-to-text if available
-            if self.speech_to_text:
-                self.speech_to_text.start()
-
-            # Start sound recognition if available
-            if self.sound_recognition:
-                self.sound_recognition.start()
-
-            # Start simulator if available
-            if self.simulator:
-                self.simulator.start()
+            # Start the wearable device, speech-to-text, sound recognition and
+            # simulator (where available) in parallel
+            self._run_concurrently([
+                self.wearable.start,
+                self.speech_to_text.start if self.speech_to_text else None,
+                self.sound_recognition.start if self.sound_recognition else None,
+                self.simulator.start if self.simulator else None
+            ])
 
             # Show startup message
             self.app.show_notification("SenseBridge is ready!")
@@ -166,9 +185,7 @@ class SenseBridge:
             else:
                 # Headless mode - just keep running
                 self.logger.info("Running in headless mode")
-                global running
-                while running:
-                    time.sleep(1)
+                self._shutdown.wait()
 
         except Exception as e:
             self.logger.error(f"Error starting SenseBridge: {str(e)}")
@@ -183,6 +200,7 @@ class SenseBridge:
 
         def timeout_handler():
             self.logger.info(f"Timeout of {timeout} seconds reached")
+            self._shutdown.set()
             self.stop()
 
         # Start timeout thread
@@ -197,18 +215,18 @@ class SenseBridge:
         """Stop all SenseBridge components."""
         self.logger.info("Stopping SenseBridge...")
 
-        # Stop components in reverse order
-        if self.simulator:
-            self.simulator.stop()
-
-        if self.sound_recognition:
-            self.sound_recognition.stop()
-
-        if self.speech_to_text:
-            self.speech_to_text.stop()
+        # Stop components in reverse order, the independent ones in parallel
+        self._run_concurrently([
+            self.simulator.stop if self.simulator else None,
+            self.sound_recognition.stop if self.sound_recognition else None,
+            self.speech_to_text.stop if self.speech_to_text else None,
+            self.wearable.stop if self.wearable else None
+        ])
 
-        if self.wearable:
-            self.wearable.stop()
+        if self._sound_event_thread:
+            self._sound_events.put(None)
+            self._sound_event_thread.join(timeout=1.0)
+            self._sound_event_thread = None
 
         if self.notification_manager:
             self.notification_manager.stop()
@@ -219,9 +237,75 @@ class SenseBridge:
 
         self.logger.info("SenseBridge stopped")
 
+    @staticmethod
+    def _run_concurrently(calls):
+        """Run independent component calls in parallel and wait for them all.
+
+        Args:
+            calls: Callables to run; None entries are skipped
+
+        Raises:
+            The first exception raised by any of the calls
+        """
+        calls = [call for call in calls if call]
+        if not calls:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+
+        for future in futures:
+            future.result()
+
     def on_sound_detected(self, sound_type, confidence, audio_data):
         """Callback for when a sound is detected.
 
+        Queues the event for the sound event thread and returns immediately,
+        so the detecting thread isn't blocked by notifications.
+
+        Args:
+            sound_type: Type of detected sound
+            confidence: Detection confidence
+            audio_data: Raw audio data
+        """
+        self._sound_events.put_nowait((sound_type, confidence, audio_data, time.monotonic()))
+
+    def _sound_event_loop(self):
+        """Dispatch detected sounds, merging rapid repeats of the same sound.
+
+        Events of the same type arriving within SOUND_EVENT_COALESCE_WINDOW of
+        the first one are dispatched once, with the highest confidence seen.
+        """
+        pending = None
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0.0, pending[3] + SOUND_EVENT_COALESCE_WINDOW - time.monotonic())
+
+            try:
+                event = self._sound_events.get(timeout=timeout)
+            except queue.Empty:
+                self._dispatch_sound(*pending[:3])
+                pending = None
+                continue
+
+            if event is None:
+                if pending:
+                    self._dispatch_sound(*pending[:3])
+                break
+
+            if pending and event[0] == pending[0] and event[3] - pending[3] < SOUND_EVENT_COALESCE_WINDOW:
+                if event[1] > pending[1]:
+                    pending = (event[0], event[1], event[2], pending[3])
+                continue
+
+            if pending:
+                self._dispatch_sound(*pending[:3])
+            pending = event
+
+    def _dispatch_sound(self, sound_type, confidence, audio_data):
+        """Notify about a detected sound and update the GUI and simulator.
+
         Args:
             sound_type: Type of detected sound
             confidence: Detection confidence
@@ -229,24 +313,34 @@ class SenseBridge:
         """
         self.logger.info(f"Sound detected: {sound_type} (confidence: {confidence:.2f})")
 
-        # Notify through the notification manager
-        self.notification_manager.notify(sound_type, confidence, audio_data)
+        try:
+            # Notify through the notification manager
+            self.notification_manager.notify(sound_type, confidence, audio_data)
 
-        # Update GUI
-        self.app.show_notification(f"Detected: {sound_type.capitalize()}")
-        self.app.update_status_message(f"Last event: {sound_type} ({confidence:.2f})")
+            # Update GUI
+            self.app.show_notification(f"Detected: {sound_type.capitalize()}")
+            self.app.update_status_message(f"Last event: {sound_type} ({confidence:.2f})")
 
-        # Update simulator if available
-        if self.simulator:
-            self.simulator.log_event(f"Detected sound: {sound_type} ({confidence:.2f})")
+            # Update simulator if available
+            if self.simulator:
+                self.simulator.log_event(f"Detected sound: {sound_type} ({confidence:.2f})")
+
+        except Exception as e:
+            self.logger.error(f"Error dispatching sound event: {str(e)}")
 
-    def on_speech_recognized(self, text):
+    def on_speech_recognized(self, text, is_partial=False):
         """Callback for when speech is recognized.
 
         Args:
             text: Recognized speech text
+            is_partial: True for an interim hypothesis while the phrase is
+                still being recognized
         """
-        if text:
+        if text and is_partial:
+            # Interim text only updates the GUI; notifications wait for the final text
+            self.app.update_speech_text(text)
+
+        elif text:
             self.logger.info(f"Speech recognized: {text}")
 
             # Notify through the notification manager
@@ -280,9 +374,8 @@ class SenseBridge:
             sig: Signal number
             frame: Current stack frame
         """
-        global running
         self.logger.info(f"Received signal {sig}, shutting down...")
-        running = False
+        self._shutdown.set()
 
         # Stop all components
         self.stop()
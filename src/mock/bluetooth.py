@@ -23,6 +23,9 @@ class BluetoothSocket:
         print(f"Mock Bluetooth: Sent data {data}")
         return len(data)
 
+    def sendall(self, data):
+        print(f"Mock Bluetooth: Sent data {data}")
+
     def recv(self, size):
         print(f"Mock Bluetooth: Received data (mock)")
         return b'MOCK_DATA'
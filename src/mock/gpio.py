@@ -1,9 +1,11 @@
 # src/mock/gpio.py
 """Mock GPIO module for development on systems without Raspberry Pi GPIO."""
 
+import heapq
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -18,52 +20,72 @@ FALLING = "FALLING"
 RISING = "RISING"
 BOTH = "BOTH"
 
-# Store pin states
-_pin_modes = {}
-_pin_values = {}
-_pin_event_callbacks = {}
-_pin_event_bouncetime = {}
+# Number of pin slots (covers both BOARD and BCM numbering)
+MAX_PINS = 64
+
+# Store pin states in arrays indexed by pin number
+_pin_modes = [None] * MAX_PINS
+_pin_values = bytearray(MAX_PINS)
+_pin_event_callbacks = [None] * MAX_PINS
+_pin_event_bouncetime = [None] * MAX_PINS
 _pwm_instances = {}
 
+# Interval between simulated events on pins with event detection (seconds)
+EVENT_INTERVAL = 10
+
+# Simulated events are fired by one shared scheduler thread, started on the
+# first add_event_detect(). _event_queue is a heap of (fire_time, pin) and
+# _event_due holds each pin's current fire time; heap entries that no longer
+# match it (pin removed or re-added) are skipped.
+_event_queue = []
+_event_due = {}
+_event_condition = threading.Condition()
+_event_thread = None
+_event_executor = None
+
 
 # Mock functions
 def setmode(mode):
     """Set GPIO pin numbering mode."""
-    logger.debug(f"[MOCK] Setting GPIO mode to {mode}")
+    logger.debug("[MOCK] Setting GPIO mode to %s", mode)
 
 
 def setwarnings(flag):
     """Set warnings flag."""
-    logger.debug(f"[MOCK] Setting GPIO warnings to {flag}")
+    logger.debug("[MOCK] Setting GPIO warnings to %s", flag)
 
 
 def setup(pin, mode, pull_up_down=None, initial=None):
     """Set up a GPIO pin."""
     _pin_modes[pin] = mode
     if mode == OUT:
-        _pin_values[pin] = initial if initial is not None else False
-    logger.debug(f"[MOCK] Setting up GPIO pin {pin} as {mode}")
+        _pin_values[pin] = 1 if initial else 0
+    logger.debug("[MOCK] Setting up GPIO pin %s as %s", pin, mode)
 
 
 def output(pin, value):
     """Set output value for a pin."""
-    _pin_values[pin] = value
-    logger.debug(f"[MOCK] Setting GPIO pin {pin} to {value}")
+    _pin_values[pin] = 1 if value else 0
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[MOCK] Setting GPIO pin %s to %s", pin, value)
 
 
 def input(pin):
     """Get input value from a pin."""
-    value = _pin_values.get(pin, False)
-    logger.debug(f"[MOCK] Reading GPIO pin {pin}: {value}")
+    value = bool(_pin_values[pin])
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[MOCK] Reading GPIO pin %s: %s", pin, value)
     return value
 
 
 def cleanup():
     """Clean up GPIO resources."""
-    _pin_modes.clear()
-    _pin_values.clear()
-    _pin_event_callbacks.clear()
-    _pin_event_bouncetime.clear()
+    _pin_modes[:] = [None] * MAX_PINS
+    _pin_values[:] = bytes(MAX_PINS)
+    _pin_event_callbacks[:] = [None] * MAX_PINS
+    _pin_event_bouncetime[:] = [None] * MAX_PINS
+    with _event_condition:
+        _event_due.clear()
     for pwm in _pwm_instances.values():
         pwm.stop()
     _pwm_instances.clear()
@@ -74,29 +96,58 @@ def add_event_detect(pin, edge, callback=None, bouncetime=None):
     """Add event detection to a pin."""
     _pin_event_callbacks[pin] = callback
     _pin_event_bouncetime[pin] = bouncetime
-    logger.debug(f"[MOCK] Adding event detection to pin {pin} for edge {edge}")
+    logger.debug("[MOCK] Adding event detection to pin %s for edge %s", pin, edge)
 
-    # Start a thread to simulate events
+    # Schedule simulated events
     if callback:
-        def event_simulator():
-            while pin in _pin_event_callbacks:
-                # Sleep for a random time between 5-15 seconds
-                time.sleep(10)
-                # Call the callback if it's still registered
-                if pin in _pin_event_callbacks and _pin_event_callbacks[pin]:
-                    logger.debug(f"[MOCK] Simulating event on pin {pin}")
-                    _pin_event_callbacks[pin](pin)
-
-        threading.Thread(target=event_simulator, daemon=True).start()
+        _schedule_event(pin, time.monotonic() + EVENT_INTERVAL)
 
 
 def remove_event_detect(pin):
     """Remove event detection from a pin."""
-    if pin in _pin_event_callbacks:
-        del _pin_event_callbacks[pin]
-    if pin in _pin_event_bouncetime:
-        del _pin_event_bouncetime[pin]
-    logger.debug(f"[MOCK] Removing event detection from pin {pin}")
+    _pin_event_callbacks[pin] = None
+    _pin_event_bouncetime[pin] = None
+    with _event_condition:
+        _event_due.pop(pin, None)
+    logger.debug("[MOCK] Removing event detection from pin %s", pin)
+
+
+def _schedule_event(pin, fire_time):
+    """Schedule a simulated event, starting the scheduler thread if needed."""
+    global _event_thread, _event_executor
+
+    with _event_condition:
+        if _event_thread is None:
+            # Callbacks run on a small pool so a slow one doesn't delay others
+            _event_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="MockGPIOEvent")
+            _event_thread = threading.Thread(target=_event_scheduler, daemon=True)
+            _event_thread.start()
+
+        _event_due[pin] = fire_time
+        heapq.heappush(_event_queue, (fire_time, pin))
+        _event_condition.notify()
+
+
+def _event_scheduler():
+    """Fire simulated events on all pins with event detection."""
+    with _event_condition:
+        while True:
+            now = time.monotonic()
+            while _event_queue and _event_queue[0][0] <= now:
+                fire_time, pin = heapq.heappop(_event_queue)
+                if _event_due.get(pin) != fire_time:
+                    continue
+
+                # Call the callback if it's still registered
+                callback = _pin_event_callbacks[pin]
+                if callback:
+                    logger.debug("[MOCK] Simulating event on pin %s", pin)
+                    _event_executor.submit(callback, pin)
+
+                _event_due[pin] = fire_time + EVENT_INTERVAL
+                heapq.heappush(_event_queue, (fire_time + EVENT_INTERVAL, pin))
+
+            _event_condition.wait(_event_queue[0][0] - now if _event_queue else None)
 
 
 class PWM:
@@ -109,25 +160,25 @@ class PWM:
         self.duty_cycle = 0
         self.running = False
         _pwm_instances[pin] = self
-        logger.debug(f"[MOCK] Creating PWM instance for pin {pin} with frequency {frequency} Hz")
+        logger.debug("[MOCK] Creating PWM instance for pin %s with frequency %s Hz", pin, frequency)
 
     def start(self, duty_cycle):
         """Start PWM with a specified duty cycle."""
         self.duty_cycle = duty_cycle
         self.running = True
-        logger.debug(f"[MOCK] Starting PWM on pin {self.pin} with duty cycle {duty_cycle}%")
+        logger.debug("[MOCK] Starting PWM on pin %s with duty cycle %s%%", self.pin, duty_cycle)
 
     def ChangeDutyCycle(self, duty_cycle):
         """Change PWM duty cycle."""
         self.duty_cycle = duty_cycle
-        logger.debug(f"[MOCK] Changing duty cycle on pin {self.pin} to {duty_cycle}%")
+        logger.debug("[MOCK] Changing duty cycle on pin %s to %s%%", self.pin, duty_cycle)
 
     def ChangeFrequency(self, frequency):
         """Change PWM frequency."""
         self.frequency = frequency
-        logger.debug(f"[MOCK] Changing frequency on pin {self.pin} to {frequency} Hz")
+        logger.debug("[MOCK] Changing frequency on pin %s to %s Hz", self.pin, frequency)
 
     def stop(self):
         """Stop PWM."""
         self.running = False
-        logger.debug(f"[MOCK] Stopping PWM on pin {self.pin}")
\ No newline at end of file
+        logger.debug("[MOCK] Stopping PWM on pin %s", self.pin)
\ No newline at end of file
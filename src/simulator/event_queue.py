@@ -0,0 +1,82 @@
+# src/simulator/event_queue.py
+"""
+Event queue shared by the simulator windows.
+Lets other threads hand events to a Tk window's UI thread.
+"""
+
+import tkinter as tk
+from tkinter import END
+from collections import deque
+
+# Virtual event raised on the Tk root when an event is queued
+QUEUE_EVENT = "<<QueueEvent>>"
+
+# Fallback drain interval (ms), in case a producer's signal is lost
+# (e.g. when Tcl is built without thread support)
+WATCHDOG_INTERVAL = 500
+
+# The event log is trimmed back to LOG_MAX_LINES lines once it grows past
+# LOG_TRIM_LINES, so trimming happens in occasional batches
+LOG_MAX_LINES = 2000
+LOG_TRIM_LINES = 2500
+
+# Events held for the UI thread; once full, the oldest events are dropped
+EVENT_QUEUE_SIZE = 4096
+
+
+class EventQueueMixin:
+    """Queues events for a Tk window and writes them to its log.
+
+    Classes using it call _init_event_queue() when initialized, set
+    log_text, _log_insert and _log_see once the log widget exists, and
+    implement _process_events() to drain event_queue on the UI thread.
+    """
+
+    def _init_event_queue(self):
+        """Set up the event queue and log state."""
+        self.root = None
+        self.running = False
+        self.event_queue = deque(maxlen=EVENT_QUEUE_SIZE)
+
+        self.log_text = None
+        self._log_insert = None
+        self._log_see = None
+        self._log_lines = 0
+
+    def _watchdog(self):
+        """Periodically drain the queue in case a producer's signal was missed."""
+        if not self.running or not self.root:
+            return
+
+        self._process_events()
+        self.root.after(WATCHDOG_INTERVAL, self._watchdog)
+
+    def _post_event(self, event):
+        """Queue an event for the UI thread and wake it up.
+
+        Args:
+            event: Event dictionary with "type" and "data" keys
+        """
+        self.event_queue.append(event)
+
+        root = self.root
+        if root is not None:
+            try:
+                root.event_generate(QUEUE_EVENT, when="tail")
+            except (tk.TclError, RuntimeError):
+                # Window is gone or Tcl isn't threaded; the watchdog
+                # picks the event up instead
+                pass
+
+    def _insert_log(self, text):
+        """Insert one or more newline-terminated lines at the end of the log."""
+        if self._log_insert:
+            self._log_insert(END, text)
+
+            # Drop the oldest lines so the widget doesn't grow without bound
+            self._log_lines += text.count("\n")
+            if self._log_lines > LOG_TRIM_LINES:
+                self.log_text.delete("1.0", f"{self._log_lines - LOG_MAX_LINES + 1}.0")
+                self._log_lines = LOG_MAX_LINES
+
+            self._log_see(END)
@@ -9,13 +9,21 @@ from tkinter import ttk
 import logging
 import threading
 import time
+from functools import partial
 import numpy as np
-import queue
+
+from ..utils.scheduling import pin_thread_to_cpu
+from .event_queue import EventQueueMixin, QUEUE_EVENT, WATCHDOG_INTERVAL
 
 logger = logging.getLogger(__name__)
 
+# Pre-generated noise clips handed out round-robin with simulated sounds
+# (one second each at 16 kHz)
+AUDIO_POOL_SIZE = 8
+AUDIO_SAMPLES = 16000
+
 
-class SimulatorUI:
+class SimulatorUI(EventQueueMixin):
     """Provides a simulator UI for testing SenseBridge."""
 
     def __init__(self, sound_callback=None, button_callback=None):
@@ -28,9 +36,16 @@ class SimulatorUI:
         self.sound_callback = sound_callback
         self.button_callback = button_callback
 
-        self.root = None
-        self.running = False
-        self.event_queue = queue.Queue()
+        # Fake audio for simulated sounds, generated once up front
+        rng = np.random.default_rng()
+        self._audio_pool = []
+        for _ in range(AUDIO_POOL_SIZE):
+            audio_data = rng.standard_normal(AUDIO_SAMPLES, dtype=np.float32)
+            audio_data *= np.float32(0.3)
+            self._audio_pool.append(audio_data)
+        self._pool_index = 0
+
+        self._init_event_queue()
 
         # Status indicators
         self.haptic_active = False
@@ -67,12 +82,18 @@ class SimulatorUI:
 
     def _ui_thread(self):
         """Main UI thread."""
+        # Tk is single-threaded, so keep its loop on one core
+        pin_thread_to_cpu()
+
         try:
             # Create the main window
             self.root = tk.Tk()
             self.root.title("SenseBridge Simulator")
             self.root.geometry("600x400")
 
+            # Drain the event queue whenever a producer signals it
+            self.root.bind(QUEUE_EVENT, self._process_events)
+
             # Create main frame
             main_frame = ttk.Frame(self.root, padding=10)
             main_frame.pack(fill=tk.BOTH, expand=True)
@@ -83,11 +104,12 @@ class SimulatorUI:
 
             # Add sound buttons
             sound_types = ["doorbell", "knock", "alarm", "microwave_beep"]
-            for i, sound_type in enumerate(sound_types):
+            labels = [sound_type.capitalize() for sound_type in sound_types]
+            for i, (sound_type, label) in enumerate(zip(sound_types, labels)):
                 sound_btn = ttk.Button(
                     sound_frame,
-                    text=sound_type.capitalize(),
-                    command=lambda st=sound_type: self._simulate_sound(st)
+                    text=label,
+                    command=partial(self._simulate_sound, sound_type)
                 )
                 sound_btn.grid(row=0, column=i, padx=5, pady=5)
 
@@ -127,50 +149,65 @@ class SimulatorUI:
             self.log_text = tk.Text(log_frame, height=10, width=60)
             self.log_text.pack(fill=tk.BOTH, expand=True)
 
-            # Start event processing
-            self.root.after(100, self._process_events)
+            # Bind the log writers once for _insert_log
+            self._log_insert = self.log_text.insert
+            self._log_see = self.log_text.see
+
+            # Start the fallback drain
+            self.root.after(WATCHDOG_INTERVAL, self._watchdog)
 
             # Start the main loop
             self.root.protocol("WM_DELETE_WINDOW", self.stop)
             self.root.mainloop()
 
         except Exception as e:
-            logger.error(f"Error in simulator UI thread: {e}")
+            logger.error("Error in simulator UI thread: %s", e)
             self.running = False
 
-    def _process_events(self):
-        """Process events from the queue."""
+    def _process_events(self, tk_event=None):
+        """Process events from the queue.
+
+        Log messages are written to the log in a single insert, and only the
+        last LED/haptic state drained is applied to the indicators.
+        """
         if not self.running:
             return
 
+        log_lines = []
+        led_state = None
+        haptic_state = None
+
         try:
             # Process all available events
-            while not self.event_queue.empty():
-                event = self.event_queue.get_nowait()
+            while True:
+                try:
+                    event = self.event_queue.popleft()
+                except IndexError:
+                    break
+
                 event_type = event.get("type")
                 event_data = event.get("data")
 
                 if event_type == "log":
-                    self._append_log(event_data)
+                    log_lines.append(f"{event_data}\n")
                 elif event_type == "led":
-                    self._update_led(event_data)
+                    led_state = event_data
                 elif event_type == "haptic":
-                    self._update_haptic(event_data)
+                    haptic_state = event_data
 
-        except queue.Empty:
-            pass
-        except Exception as e:
-            logger.error(f"Error processing events: {e}")
+            if log_lines:
+                self._insert_log("".join(log_lines))
+            if led_state is not None:
+                self._update_led(led_state)
+            if haptic_state is not None:
+                self._update_haptic(haptic_state)
 
-        # Schedule next processing
-        if self.running and self.root:
-            self.root.after(100, self._process_events)
+        except Exception as e:
+            logger.error("Error processing events: %s", e)
 
     def _append_log(self, message):
         """Append a message to the log."""
-        if self.log_text:
-            self.log_text.insert(tk.END, f"{message}\n")
-            self.log_text.see(tk.END)
+        self._insert_log(f"{message}\n")
 
     def _update_led(self, state):
         """Update the LED indicator."""
@@ -190,21 +227,25 @@ class SimulatorUI:
 
     def _simulate_sound(self, sound_type):
         """Simulate a sound event."""
-        self.event_queue.put({
+        self._post_event({
             "type": "log",
             "data": f"Simulating sound: {sound_type}"
         })
 
         if self.sound_callback:
-            # Create a simple audio sample
-            audio_data = np.random.normal(0, 0.3, 16000).astype(np.float32)
+            audio_data = self._audio_pool[self._pool_index]
+            self._pool_index = (self._pool_index + 1) % AUDIO_POOL_SIZE
 
-            # Call the callback
-            self.sound_callback(sound_type, 0.8, audio_data)
+            # Call the callback off the Tk thread so the UI stays responsive
+            threading.Thread(
+                target=self.sound_callback,
+                args=(sound_type, 0.8, audio_data),
+                daemon=True
+            ).start()
 
     def _simulate_button_press(self):
         """Simulate a button press."""
-        self.event_queue.put({
+        self._post_event({
             "type": "log",
             "data": "Simulating button press"
         })
@@ -219,7 +260,7 @@ class SimulatorUI:
             message: Message to log
         """
         if self.running:
-            self.event_queue.put({
+            self._post_event({
                 "type": "log",
                 "data": message
             })
@@ -231,7 +272,7 @@ class SimulatorUI:
             state: True for on, False for off
         """
         if self.running:
-            self.event_queue.put({
+            self._post_event({
                 "type": "led",
                 "data": state
             })
@@ -243,7 +284,7 @@ class SimulatorUI:
             state: True for on, False for off
         """
         if self.running:
-            self.event_queue.put({
+            self._post_event({
                 "type": "haptic",
                 "data": state
             })
\ No newline at end of file
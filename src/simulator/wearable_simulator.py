@@ -9,27 +9,38 @@ from tkinter import ttk
 import logging
 import threading
 import time
-import queue
 import json
 
+from ..utils.scheduling import pin_thread_to_cpu
+from .event_queue import EventQueueMixin, QUEUE_EVENT, WATCHDOG_INTERVAL
+
 logger = logging.getLogger(__name__)
 
+# orjson is optional and only used to speed up decoding string commands
+try:
+    from orjson import loads as _decode
+except ImportError:
+    _decode = json.JSONDecoder().decode
+
+# Vibration length (ms) for commands that don't specify a duration
+DEFAULT_VIBRATION_DURATION = 500
 
-class WearableSimulator:
+
+class WearableSimulator(EventQueueMixin):
     """Simulates a Bluetooth wearable device for testing."""
 
     def __init__(self):
         """Initialize the wearable simulator."""
-        self.root = None
-        self.running = False
-        self.event_queue = queue.Queue()
+        self._init_event_queue()
 
         # Vibration state
         self.vibrating = False
         self.vibration_indicator = None
+        self._vibration_after_id = None
 
-        # Command log
-        self.log_text = None
+        # Formatted timestamp of the last logged second, reused within it
+        self._timestamp_second = -1
+        self._timestamp = ""
 
     def start(self):
         """Start the wearable simulator in a separate thread."""
@@ -58,12 +69,18 @@ class WearableSimulator:
 
     def _ui_thread(self):
         """Main UI thread."""
+        # Tk is single-threaded, so keep its loop on one core
+        pin_thread_to_cpu()
+
         try:
             # Create the main window
             self.root = tk.Tk()
             self.root.title("SenseBridge Wearable Simulator")
             self.root.geometry("400x300")
 
+            # Drain the event queue whenever a producer signals it
+            self.root.bind(QUEUE_EVENT, self._process_events)
+
             # Create main frame
             main_frame = ttk.Frame(self.root, padding=10)
             main_frame.pack(fill=tk.BOTH, expand=True)
@@ -95,13 +112,17 @@ class WearableSimulator:
             self.log_text = tk.Text(log_frame, height=10, width=40)
             self.log_text.pack(fill=tk.BOTH, expand=True)
 
+            # Bind the log writers once for _insert_log
+            self._log_insert = self.log_text.insert
+            self._log_see = self.log_text.see
+
             # Add a scrollbar to the log
             scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             self.log_text.configure(yscrollcommand=scrollbar.set)
 
-            # Start event processing
-            self.root.after(100, self._process_events)
+            # Start the fallback drain
+            self.root.after(WATCHDOG_INTERVAL, self._watchdog)
 
             # Log startup
             self._append_log("Wearable simulator started")
@@ -111,54 +132,85 @@ class WearableSimulator:
             self.root.mainloop()
 
         except Exception as e:
-            logger.error(f"Error in wearable simulator UI thread: {e}")
+            logger.error("Error in wearable simulator UI thread: %s", e)
             self.running = False
 
-    def _process_events(self):
-        """Process events from the queue."""
+    def _process_events(self, tk_event=None):
+        """Process events from the queue.
+
+        Log messages are written to the log in a single insert, and only the
+        last vibration state drained is applied to the indicator.
+        """
         if not self.running:
             return
 
+        log_lines = []
+        vibration = None
+
         try:
             # Process all available events
-            while not self.event_queue.empty():
-                event = self.event_queue.get_nowait()
+            while True:
+                try:
+                    event = self.event_queue.popleft()
+                except IndexError:
+                    break
+
                 event_type = event.get("type")
                 event_data = event.get("data")
 
                 if event_type == "log":
-                    self._append_log(event_data)
+                    log_lines.append(self._format_log_line(event_data))
                 elif event_type == "vibrate":
-                    self._set_vibration(event_data.get("active", False))
+                    vibration = event_data
 
-        except queue.Empty:
-            pass
-        except Exception as e:
-            logger.error(f"Error processing events: {e}")
+            if log_lines:
+                self._insert_log("".join(log_lines))
+            if vibration is not None:
+                self._set_vibration(vibration.get("active", False),
+                                    vibration.get("duration", DEFAULT_VIBRATION_DURATION))
 
-        # Schedule next processing
-        if self.running and self.root:
-            self.root.after(100, self._process_events)
+        except Exception as e:
+            logger.error("Error processing events: %s", e)
 
     def _append_log(self, message):
         """Append a message to the log."""
-        if self.log_text:
-            timestamp = time.strftime("%H:%M:%S")
-            self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-            self.log_text.see(tk.END)
+        self._insert_log(self._format_log_line(message))
 
-    def _set_vibration(self, active):
-        """Set the vibration indicator state."""
+    def _format_log_line(self, message):
+        """Format a message as a timestamped log line."""
+        now = int(time.time())
+        if now != self._timestamp_second:
+            self._timestamp_second = now
+            self._timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        return f"[{self._timestamp}] {message}\n"
+
+    def _set_vibration(self, active, duration=DEFAULT_VIBRATION_DURATION):
+        """Set the vibration indicator state.
+
+        Args:
+            active: True if the wearable is vibrating
+            duration: Time (ms) after which an active vibration turns off
+        """
         if self.vibration_indicator:
+            # A new state replaces any pending auto-disable
+            if self._vibration_after_id is not None:
+                self.root.after_cancel(self._vibration_after_id)
+                self._vibration_after_id = None
+
             if active:
                 self.vibration_indicator.config(text="ON", background="orange")
 
-                # Auto-disable after a short time
+                # Auto-disable once the vibration has run for its duration
                 if self.running and self.root:
-                    self.root.after(500, lambda: self._set_vibration(False))
+                    self._vibration_after_id = self.root.after(int(duration), self._end_vibration)
             else:
                 self.vibration_indicator.config(text="OFF", background="gray")
 
+    def _end_vibration(self):
+        """Turn the vibration indicator off when a vibration finishes."""
+        self._vibration_after_id = None
+        self._set_vibration(False)
+
     def simulate_command(self, command_data):
         """Simulate receiving a command from SenseBridge.
 
@@ -167,35 +219,31 @@ class WearableSimulator:
         """
         if isinstance(command_data, str):
             try:
-                command_data = json.loads(command_data)
-            except:
+                command_data = _decode(command_data)
+            except ValueError:
                 command_data = {"cmd": command_data}
 
         cmd = command_data.get("cmd", "unknown")
         params = command_data.get("params", {})
 
-        # Log the command
+        # Build the log line for the command
         cmd_str = f"Command: {cmd}"
         if params:
             cmd_str += f" - Params: {params}"
 
-        self.event_queue.put({
-            "type": "log",
-            "data": cmd_str
-        })
-
         # Handle specific commands
         if cmd == "vibrate":
             intensity = params.get("intensity", 1.0)
-            duration = params.get("duration", 500)
+            duration = params.get("duration", DEFAULT_VIBRATION_DURATION)
 
-            self.event_queue.put({
+            self._post_event({
                 "type": "vibrate",
-                "data": {"active": True, "intensity": intensity}
+                "data": {"active": True, "intensity": intensity, "duration": duration}
             })
 
-            # Log additional info
-            self.event_queue.put({
-                "type": "log",
-                "data": f"Vibrating with intensity {intensity} for {duration}ms"
-            })
\ No newline at end of file
+            cmd_str += f" | Vibrating with intensity {intensity} for {duration}ms"
+
+        self._post_event({
+            "type": "log",
+            "data": cmd_str
+        })
\ No newline at end of file
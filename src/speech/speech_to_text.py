@@ -9,6 +9,7 @@ import queue
 import time
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +22,38 @@ except ImportError:
     SR_AVAILABLE = False
     sr = None
 
+# faster-whisper is optional; when installed, phrases are transcribed on the
+# device instead of being sent to the Google Web Speech API
+try:
+    import numpy as np
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
 from ..utils.config import Config
+from ..utils.scheduling import lower_thread_priority
+
+# Minimum time between partial results sent to the callback (seconds)
+PARTIAL_INTERVAL = 0.3
 
 
 class SpeechToText:
     """Speech-to-text recognition module."""
 
-    def __init__(self, text_callback=None):
+    # Microphone names, shared by all instances as enumerating the audio
+    # devices is slow
+    _mic_cache = None
+
+    def __init__(self, text_callback=None, max_buffer_seconds=None):
         """Initialize the speech-to-text system.
 
         Args:
-            text_callback: Callback function for recognized text
+            text_callback: Callback function for recognized text, called as
+                callback(text) for final results and as
+                callback(text, is_partial=True) for interim results, which
+                only the local Whisper backend produces
+            max_buffer_seconds: Maximum audio to buffer for one phrase; caps
+                the phrase time limit (None for no limit)
         """
         self.config = Config()
         self.user_prefs = self.config.get_user_preferences()
@@ -45,6 +67,11 @@ class SpeechToText:
         self.energy_threshold = self.speech_config.get("energy_threshold", 300)
         self.adjust_for_ambient_noise = self.speech_config.get("adjust_for_ambient_noise", True)
         self.pause_threshold = self.speech_config.get("pause_threshold", 0.8)
+        self.whisper_model = self.speech_config.get("whisper_model", "small.en")
+
+        # A phrase's audio is buffered until it ends, so bound its length
+        if max_buffer_seconds and (not self.phrase_time_limit or self.phrase_time_limit > max_buffer_seconds):
+            self.phrase_time_limit = max_buffer_seconds
 
         # Add detection for simulation mode
         self.in_simulation = "--simulation" in sys.argv or hasattr(sys, 'simulation_mode')
@@ -54,8 +81,12 @@ class SpeechToText:
             self.recognizer = sr.Recognizer()
             self.recognizer.energy_threshold = self.energy_threshold
             self.recognizer.pause_threshold = self.pause_threshold
-            self.available_mics = self._get_available_microphones()
-            logger.info(f"Available microphones: {self.available_mics}")
+            # The microphone list is only used for logging
+            if logger.isEnabledFor(logging.INFO):
+                self.available_mics = self._get_available_microphones()
+                logger.info("Available microphones: %s", self.available_mics)
+            else:
+                self.available_mics = []
             self.sr_available = True
         else:
             logger.warning("Speech recognition library not available")
@@ -66,9 +97,13 @@ class SpeechToText:
         self.microphone = None
         self.mic_source = None
 
+        # Local Whisper model, loaded when listening starts
+        self._whisper = None
+
         # Thread for continuous recognition
         self.listen_thread = None
         self.running = False
+        self._stop_event = threading.Event()
 
         # Queue for recognized text
         self.text_queue = queue.Queue()
@@ -76,6 +111,11 @@ class SpeechToText:
         # Callback function for recognized text
         self.callback = text_callback
 
+        # Interim hypothesis state for the current phrase
+        self._last_hypothesis = []
+        self._committed_words = 0
+        self._last_partial_time = 0.0
+
         logger.info("SpeechToText initialized")
     def start(self):
         """Start listening for speech."""
@@ -84,6 +124,7 @@ class SpeechToText:
             return
 
         self.running = True
+        self._stop_event.clear()
 
         # Skip actual audio processing in simulation mode
         if self.in_simulation:
@@ -110,7 +151,7 @@ class SpeechToText:
                 logger.info("Adjusting for ambient noise...")
                 with sr.Microphone() as source:
                     self.recognizer.adjust_for_ambient_noise(source, duration=2)
-                logger.info(f"Energy threshold set to {self.recognizer.energy_threshold}")
+                logger.info("Energy threshold set to %s", self.recognizer.energy_threshold)
 
             # Start listening thread
             logger.info("Starting continuous speech recognition")
@@ -120,7 +161,7 @@ class SpeechToText:
 
             logger.info("Speech to text started")
         except Exception as e:
-            logger.error(f"Error starting speech recognition: {str(e)}")
+            logger.error("Error starting speech recognition: %s", e)
             self.running = False
 
     def stop(self):
@@ -129,6 +170,7 @@ class SpeechToText:
             return
 
         self.running = False
+        self._stop_event.set()
 
         if self.listen_thread:
             self.listen_thread.join(timeout=2.0)
@@ -164,81 +206,254 @@ class SpeechToText:
         except queue.Empty:
             return None
 
-    def _get_available_microphones(self):
+    def _emit_partial(self, hypothesis):
+        """Report the stable prefix of an interim hypothesis.
+
+        Uses LocalAgreement-2: words on which the last two hypotheses for
+        the current phrase agree are committed and sent to the callback as a
+        partial result, at most once every PARTIAL_INTERVAL seconds.
+
+        Args:
+            hypothesis: Latest interim transcription of the current phrase
+        """
+        words = hypothesis.split()
+        agreed = 0
+        for previous, current in zip(self._last_hypothesis, words):
+            if previous != current:
+                break
+            agreed += 1
+        self._last_hypothesis = words
+
+        now = time.monotonic()
+        if agreed <= self._committed_words or now - self._last_partial_time < PARTIAL_INTERVAL:
+            return
+
+        self._committed_words = agreed
+        self._last_partial_time = now
+        if self.callback:
+            self.callback(" ".join(words[:agreed]), is_partial=True)
+
+    def _reset_partial(self):
+        """Clear interim hypothesis state once a phrase is final."""
+        self._last_hypothesis = []
+        self._committed_words = 0
+
+    @classmethod
+    def _get_available_microphones(cls):
         """Get a list of available microphones.
 
+        The devices are enumerated once and cached on the class.
+
         Returns:
             List of microphone names
         """
         if not SR_AVAILABLE:
             return []
 
+        if cls._mic_cache is not None:
+            return list(cls._mic_cache)
+
         try:
-            mic_list = sr.Microphone.list_microphone_names()
-            return mic_list
+            cls._mic_cache = sr.Microphone.list_microphone_names()
+            return list(cls._mic_cache)
         except Exception as e:
-            logger.error(f"Error getting microphone list: {str(e)}")
+            logger.error("Error getting microphone list: %s", e)
             return []
 
+    def _load_whisper(self):
+        """Load the local Whisper model if faster-whisper is installed."""
+        if WhisperModel is None or self._whisper is not None:
+            return
+
+        try:
+            logger.info("Loading Whisper model %s", self.whisper_model)
+            self._whisper = WhisperModel(self.whisper_model, device="cpu",
+                                         compute_type="int8", cpu_threads=4)
+        except Exception as e:
+            logger.warning("Could not load Whisper model, using Google speech recognition: %s", e)
+
+    def _recognize(self, audio):
+        """Transcribe a captured phrase.
+
+        Uses the local Whisper model when it is loaded, otherwise the Google
+        Web Speech API.
+
+        Args:
+            audio: sr.AudioData for the phrase
+
+        Returns:
+            Recognized text
+
+        Raises:
+            sr.UnknownValueError: If no speech was recognized
+            sr.RequestError: If the Google service could not be reached
+        """
+        if self._whisper is None:
+            return self.recognizer.recognize_google(audio, language=self.language)
+
+        # Whisper expects 16 kHz mono float samples in [-1, 1]
+        raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        segments, _ = self._whisper.transcribe(samples, language=self.language.split("-")[0],
+                                               beam_size=1, vad_filter=True)
+
+        # Segments are decoded lazily, so report the text so far as an
+        # interim hypothesis each time another segment arrives
+        texts = []
+        for segment in segments:
+            texts.append(segment.text.strip())
+            self._emit_partial(" ".join(texts))
+        text = " ".join(texts).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+    def _probe_microphone(self, mic_index):
+        """Open a microphone and calibrate it to the ambient noise.
+
+        Args:
+            mic_index: Device index of the microphone
+
+        Returns:
+            (source, energy_threshold) tuple for the opened microphone
+        """
+        logger.info("Trying microphone with index %s", mic_index)
+        source = sr.Microphone(device_index=mic_index)
+        source.__enter__()
+        try:
+            # Calibrate with a separate recognizer, so a failed probe leaves
+            # the main recognizer's threshold untouched
+            recognizer = sr.Recognizer()
+            recognizer.energy_threshold = self.energy_threshold
+            recognizer.adjust_for_ambient_noise(source, duration=2)
+        except Exception:
+            source.__exit__(None, None, None)
+            raise
+        return source, recognizer.energy_threshold
+
+    @staticmethod
+    def _input_device_indices(mic_indices):
+        """Drop device indices that don't exist or can't record.
+
+        The devices are enumerated on a single PyAudio instance, so only
+        real input devices go on to be opened and calibrated.
+
+        Args:
+            mic_indices: Device indices, most preferred first
+
+        Returns:
+            The input device indices, in the same order
+        """
+        try:
+            pa = sr.Microphone.get_pyaudio().PyAudio()
+        except Exception as e:
+            logger.warning("Could not enumerate audio devices: %s", e)
+            return list(mic_indices)
+
+        try:
+            device_count = pa.get_device_count()
+            return [i for i in mic_indices
+                    if i < device_count and pa.get_device_info_by_index(i)["maxInputChannels"] > 0]
+        finally:
+            pa.terminate()
+
+    def _find_microphone(self, mic_indices):
+        """Pick the preferred working microphone.
+
+        Microphones are opened and calibrated one at a time, as PortAudio
+        initialization is not thread-safe. Indices that are not input
+        devices are skipped without spending two seconds calibrating them.
+        The recognizer's energy threshold is taken from the chosen
+        microphone's calibration.
+
+        Args:
+            mic_indices: Device indices to try, most preferred first
+
+        Returns:
+            Device index of the chosen microphone, or None if none worked
+        """
+        for mic_index in self._input_device_indices(mic_indices):
+            try:
+                source, energy_threshold = self._probe_microphone(mic_index)
+            except Exception as e:
+                logger.warning("Could not use microphone with index %s: %s", mic_index, e)
+                continue
+
+            source.__exit__(None, None, None)
+            self.recognizer.energy_threshold = energy_threshold
+            logger.info("Successfully connected to microphone %s", mic_index)
+            return mic_index
+        return None
+
     def _listen_loop(self):
-        """Main loop for continuous speech recognition."""
+        """Capture speech in the background until stopped.
+
+        Phrases are captured on the recognizer's background listening thread
+        and handed to a recognition worker, so the next phrase is captured
+        while the previous one is being transcribed.
+        """
         if not SR_AVAILABLE:
             logger.error("Speech recognition library not available")
             return
 
-        # Try different microphone indices
+        # Let sound detection take priority over speech capture and recognition
+        lower_thread_priority()
+
         # Try microphone indices that correspond to actual microphones, not audio outputs
         mic_indices_to_try = [13, 14, 15, 16, 5, 4, 1, 0]
 
-        for mic_index in mic_indices_to_try:
-            try:
-                logger.info(f"Trying microphone with index {mic_index}")
-                with sr.Microphone(device_index=mic_index) as source:
-                    self.mic_source = source
+        self._load_whisper()
 
-                    # Test a simple listen with longer adjustment
-                    self.recognizer.adjust_for_ambient_noise(source, duration=2)
-                    logger.info(f"Successfully connected to microphone {mic_index}")
-
-                    # Now enter the main recognition loop with this working microphone
-                    while self.running:
-                        try:
-                            audio = self.recognizer.listen(source, timeout=self.timeout,
-                                                           phrase_time_limit=self.phrase_time_limit)
-
-                            # Try to recognize the speech
-                            try:
-                                text = self.recognizer.recognize_google(audio, language=self.language)
-                                logger.info(f"Recognized: {text}")
-
-                                # Add to queue
-                                self.text_queue.put(text)
-
-                                # Call callback if set
-                                if self.callback:
-                                    self.callback(text)
-
-                            except sr.UnknownValueError:
-                                # Speech was unintelligible
-                                pass
-                            except sr.RequestError as e:
-                                logger.warning(f"Speech recognition service error: {e}")
-                                time.sleep(1)  # Wait a bit before retrying
-
-                        except Exception as e:
-                            logger.error(f"Error in speech recognition: {str(e)}")
-                            time.sleep(0.5)
-
-                    # If we reach here, the loop was exited
-                    return
+        mic_index = self._find_microphone(mic_indices_to_try)
+        if mic_index is None:
+            logger.error("Could not connect to any microphone")
+            return
 
-            except Exception as e:
-                logger.warning(f"Could not use microphone with index {mic_index}: {str(e)}")
+        self.mic_source = sr.Microphone(device_index=mic_index)
+
+        # A single worker keeps results in the order they were spoken
+        with ThreadPoolExecutor(max_workers=1) as recognition_pool:
+            def on_audio(recognizer, audio):
+                recognition_pool.submit(self._recognize_and_dispatch, audio)
+
+            stop_listening = self.recognizer.listen_in_background(
+                self.mic_source, on_audio, phrase_time_limit=self.phrase_time_limit)
+            self._stop_event.wait()
+            stop_listening(wait_for_stop=True)
+
+    def _recognize_and_dispatch(self, audio):
+        """Recognize a captured phrase and deliver the text.
+
+        Args:
+            audio: sr.AudioData for the phrase
+        """
+        self._reset_partial()
+        try:
+            text = self._recognize(audio)
+        except sr.UnknownValueError:
+            # Speech was unintelligible
+            return
+        except sr.RequestError as e:
+            logger.warning("Speech recognition service error: %s", e)
+            self._stop_event.wait(1)  # Wait a bit before retrying
+            return
+        except Exception as e:
+            logger.error("Error in speech recognition: %s", e)
+            return
+
+        logger.info("Recognized: %s", text)
+
+        # Add to queue
+        self.text_queue.put(text)
+
+        # Call callback if set
+        if self.callback:
+            self.callback(text)
 
-        # If we reach here, none of the microphones worked
-        logger.error("Could not connect to any microphone")
     def _simulation_loop(self):
         """Simulation loop that generates fake speech events for testing."""
+        lower_thread_priority()
+
         test_phrases = [
             "Help me",
             "What was that noise",
@@ -251,13 +466,14 @@ class SpeechToText:
 
         while self.running and recognitions < max_recognitions:
             try:
-                # Sleep for a while to simulate waiting for speech
-                time.sleep(60)  # One simulated phrase per minute
+                # Wait for a while to simulate waiting for speech
+                if self._stop_event.wait(60):  # One simulated phrase per minute
+                    return
 
                 # Generate a simulated speech event
                 if self.running:
                     phrase = test_phrases[recognitions % len(test_phrases)]
-                    logger.info(f"Simulation: Recognized speech: '{phrase}'")
+                    logger.info("Simulation: Recognized speech: '%s'", phrase)
 
                     # Add to queue
                     self.text_queue.put(phrase)
@@ -269,12 +485,12 @@ class SpeechToText:
                     recognitions += 1
 
             except Exception as e:
-                logger.error(f"Error in simulation loop: {str(e)}")
-                time.sleep(5)
+                logger.error("Error in simulation loop: %s", e)
+                if self._stop_event.wait(5):
+                    return
 
-        # After generating the test phrases, just sleep to keep the thread alive
-        while self.running:
-            time.sleep(10)
+        # After generating the test phrases, just wait to keep the thread alive
+        self._stop_event.wait()
 
 
 def listen_for_command():
@@ -300,15 +516,15 @@ def listen_for_command():
         # Recognize speech
         try:
             text = r.recognize_google(audio, language="en-US")
-            logger.info(f"Recognized command: {text}")
+            logger.info("Recognized command: %s", text)
             return text
         except sr.UnknownValueError:
             logger.info("Could not understand audio")
             return None
         except sr.RequestError as e:
-            logger.error(f"Recognition error: {e}")
+            logger.error("Recognition error: %s", e)
             return None
 
     except Exception as e:
-        logger.error(f"Error listening for command: {str(e)}")
+        logger.error("Error listening for command: %s", e)
         return None
\ No newline at end of file
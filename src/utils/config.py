@@ -10,6 +10,25 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional and only used to speed up parsing config files
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+def _load(path):
+    """Load a JSON config file.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
 
 class Config:
     """Handles application configuration."""
@@ -57,8 +76,7 @@ class Config:
         """Load device configuration."""
         try:
             if self.device_config_path.exists():
-                with open(self.device_config_path, 'r') as f:
-                    self.device_config = json.load(f)
+                self.device_config = _load(self.device_config_path)
                 logger.info("Device configuration loaded")
             else:
                 # Create default device config
@@ -104,8 +122,7 @@ class Config:
         """Load sound events configuration."""
         try:
             if self.sound_events_path.exists():
-                with open(self.sound_events_path, 'r') as f:
-                    self.sound_events = json.load(f)
+                self.sound_events = _load(self.sound_events_path)
                 logger.info("Sound events configuration loaded")
             else:
                 # Create default sound events config
@@ -159,8 +176,7 @@ class Config:
         """Load user preferences."""
         try:
             if self.user_prefs_path.exists():
-                with open(self.user_prefs_path, 'r') as f:
-                    self.user_preferences = json.load(f)
+                self.user_preferences = _load(self.user_prefs_path)
                 logger.info("User preferences loaded")
             else:
                 # Create default user preferences
@@ -1,11 +1,56 @@
 # src/utils/hardware_detection.py
 import os
+import sys
+import json
+import atexit
 import platform
 import logging
 import importlib.util
+from dataclasses import dataclass, asdict
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Result of the audio device check, shared by all detectors because
+# enumerating PortAudio devices is slow
+_audio_available = None
+
+# Capabilities kept in the per-boot cache. Audio is left out, as devices
+# can be plugged in during the boot, and so is the display, which depends
+# on the session.
+_CACHED_CAPABILITIES = ("platform", "is_raspberry_pi", "has_gpio", "has_bluetooth")
+
+# Capabilities only checked when first read
+_LAZY_CAPABILITIES = ("has_gpio", "has_bluetooth")
+
+
+@lru_cache(maxsize=32)
+def _has_module(name):
+    """Check whether a module is installed, without importing it.
+
+    Results are cached, as each lookup searches sys.path.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@dataclass(frozen=True)
+class HardwareCapabilities:
+    """Snapshot of the detected hardware capabilities."""
+    # Declared by hand, as dataclass(slots=True) needs Python 3.10
+    __slots__ = ("platform", "is_raspberry_pi", "has_gpio", "has_audio",
+                 "has_bluetooth", "has_display")
+
+    platform: str
+    is_raspberry_pi: bool
+    has_gpio: bool
+    has_audio: bool
+    has_bluetooth: bool
+    has_display: bool
+
 
 class HardwareDetector:
     """Detects available hardware and capabilities."""
@@ -14,26 +59,66 @@ class HardwareDetector:
         """Initialize hardware detection."""
         self.platform = platform.system()
         self.is_raspberry_pi = self._detect_raspberry_pi()
-        self.has_gpio = self._check_gpio()
         self.has_audio = self._check_audio()
-        self.has_bluetooth = self._check_bluetooth()
         self.has_display = self._check_display()
 
-        logger.info(f"Hardware detection: Platform={self.platform}, "
-                    f"RaspberryPi={self.is_raspberry_pi}, "
-                    f"GPIO={self.has_gpio}, "
-                    f"Audio={self.has_audio}, "
-                    f"Bluetooth={self.has_bluetooth}, "
-                    f"Display={self.has_display}")
+        # GPIO and Bluetooth need their modules imported to check, so they
+        # are only checked and logged when first used (see has_gpio and
+        # has_bluetooth)
+        logger.info("Hardware detection: Platform=%s, RaspberryPi=%s, Audio=%s, Display=%s",
+                    self.platform, self.is_raspberry_pi, self.has_audio, self.has_display)
+
+    @classmethod
+    def from_capabilities(cls, capabilities):
+        """Create a detector from previously detected capabilities.
+
+        Nothing is probed except the display, which depends on the session,
+        and audio when the mapping leaves it out.
+
+        Args:
+            capabilities: Mapping as returned by get_capabilities(), optionally
+                without "has_audio"
+
+        Returns:
+            HardwareDetector instance
+        """
+        detector = cls.__new__(cls)
+        detector.platform = capabilities["platform"]
+        detector.is_raspberry_pi = capabilities["is_raspberry_pi"]
+        has_audio = capabilities.get("has_audio")
+        detector.has_audio = detector._check_audio() if has_audio is None else has_audio
+        detector.has_display = detector._check_display()
+
+        # GPIO and Bluetooth are left to be checked lazily if they weren't cached
+        for name in _LAZY_CAPABILITIES:
+            if name in capabilities:
+                setattr(detector, name, capabilities[name])
+        return detector
+
+    @cached_property
+    def has_gpio(self):
+        """Whether real GPIO access is available, checked on first access."""
+        has_gpio = self._check_gpio()
+        logger.info("Hardware detection: GPIO=%s", has_gpio)
+        return has_gpio
+
+    @cached_property
+    def has_bluetooth(self):
+        """Whether Bluetooth is available, checked on first access."""
+        has_bluetooth = self._check_bluetooth()
+        logger.info("Hardware detection: Bluetooth=%s", has_bluetooth)
+        return has_bluetooth
 
     def _detect_raspberry_pi(self):
         """Detect if running on Raspberry Pi."""
-        # Check for Raspberry Pi-specific files
-        if os.path.exists('/proc/device-tree/model'):
-            with open('/proc/device-tree/model') as f:
-                model = f.read()
-                if 'Raspberry Pi' in model:
+        # Check the device tree model, opening it directly rather than
+        # checking that it exists first
+        try:
+            with open('/proc/device-tree/model', 'rb') as f:
+                if b'Raspberry Pi' in f.read():
                     return True
+        except OSError:
+            pass
 
         # Check for /etc/rpi-issue which is present on Raspberry Pi OS
         if os.path.exists('/etc/rpi-issue'):
@@ -43,42 +128,53 @@ class HardwareDetector:
 
     def _check_gpio(self):
         """Check if GPIO access is available."""
-        try:
-            # Try to import RPi.GPIO
-            import RPi.GPIO
-            return True
-        except ImportError:
-            # Try to import the mock module
+        # find_spec rules out a missing module without paying for the import
+        if _has_module('RPi.GPIO'):
             try:
-                spec = importlib.util.find_spec('src.mock.gpio')
-                if spec is not None:
-                    return False  # Mock available, but not real GPIO
-            except:
+                import RPi.GPIO
+                return True
+            except (ImportError, RuntimeError):
                 pass
 
-            logger.warning("GPIO access not available")
-            return False
+        # Check for the mock module
+        if _has_module('src.mock.gpio'):
+            return False  # Mock available, but not real GPIO
+
+        logger.warning("GPIO access not available")
+        return False
 
     def _check_audio(self):
         """Check if audio capture is available."""
+        global _audio_available
+        if not _has_module('pyaudio'):
+            logger.warning("Audio capture not available")
+            return False
+
+        if _audio_available is not None:
+            return _audio_available
+
         try:
             import pyaudio
             p = pyaudio.PyAudio()
             input_device_count = p.get_device_count()
             p.terminate()
-            return input_device_count > 0
+            _audio_available = input_device_count > 0
         except:
             logger.warning("Audio capture not available")
-            return False
+            _audio_available = False
+        return _audio_available
 
     def _check_bluetooth(self):
         """Check if Bluetooth is available."""
-        try:
-            import bluetooth
-            return True
-        except ImportError:
-            logger.warning("Bluetooth not available")
-            return False
+        if _has_module('bluetooth'):
+            try:
+                import bluetooth
+                return True
+            except ImportError:
+                pass
+
+        logger.warning("Bluetooth not available")
+        return False
 
     def _check_display(self):
         """Check if display is available."""
@@ -96,25 +192,144 @@ class HardwareDetector:
 
         return False
 
+    @cached_property
+    def pyaudio_instance(self):
+        """PyAudio instance shared by audio users, created on first access.
+
+        It is terminated when the interpreter exits.
+        """
+        import pyaudio
+        p = pyaudio.PyAudio()
+        atexit.register(p.terminate)
+        return p
+
+    @cached_property
+    def capabilities(self):
+        """HardwareCapabilities snapshot, built on first access."""
+        return HardwareCapabilities(
+            platform=self.platform,
+            is_raspberry_pi=self.is_raspberry_pi,
+            has_gpio=self.has_gpio,
+            has_audio=self.has_audio,
+            has_bluetooth=self.has_bluetooth,
+            has_display=self.has_display
+        )
+
+    @cached_property
+    def _capabilities_view(self):
+        """Read-only mapping of the capabilities, shared by all callers."""
+        return MappingProxyType(asdict(self.capabilities))
+
     def get_capabilities(self):
-        """Get a dictionary of available hardware capabilities."""
-        return {
-            "platform": self.platform,
-            "is_raspberry_pi": self.is_raspberry_pi,
-            "has_gpio": self.has_gpio,
-            "has_audio": self.has_audio,
-            "has_bluetooth": self.has_bluetooth,
-            "has_display": self.has_display
-        }
+        """Get a read-only mapping of available hardware capabilities.
+
+        This checks GPIO and Bluetooth if they haven't been checked yet.
+        """
+        return self._capabilities_view
+
+    def get_checked_capabilities(self):
+        """Get the capabilities checked so far, without running lazy checks.
+
+        Returns:
+            Dictionary of the capabilities already known
+        """
+        known = vars(self)
+        return {name: known[name] for name in HardwareCapabilities.__slots__ if name in known}
 
 
 # Create a singleton instance
 _hardware_detector = None
 
 
+def _capabilities_cache_file():
+    """Get the path of the file caching detected capabilities.
+
+    Uses the per-user runtime directory where there is one, as it is on
+    tmpfs and cleared on reboot.
+    """
+    if hasattr(os, "getuid"):
+        runtime_dir = os.path.join("/run/user", str(os.getuid()))
+        if os.path.isdir(runtime_dir):
+            return os.path.join(runtime_dir, "sensebridge_hw.json")
+    return os.path.join(os.path.expanduser("~"), ".cache", "sensebridge", "hardware.json")
+
+
+def _capabilities_cache_key():
+    """Identify the boot and interpreter that cached capabilities are valid for."""
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            boot_id = f.read().strip()
+    except OSError:
+        boot_id = None
+    return {"boot_id": boot_id, "kernel": platform.release(), "python": sys.executable}
+
+
+def _load_cached_detector():
+    """Create a detector from the capabilities cache, if it is still valid.
+
+    Returns:
+        HardwareDetector instance, or None if there is no valid cache
+    """
+    try:
+        with open(_capabilities_cache_file(), 'r') as f:
+            cached = json.load(f)
+        if cached["key"] != _capabilities_cache_key():
+            return None
+        capabilities = cached["capabilities"]
+        capabilities.pop("has_audio", None)  # Written by older versions
+        return HardwareDetector.from_capabilities(capabilities)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_cached_detector(detector):
+    """Write a detector's checked capabilities to the capabilities cache.
+
+    GPIO and Bluetooth are only written once something has checked them.
+    """
+    checked = detector.get_checked_capabilities()
+    capabilities = {name: checked[name] for name in _CACHED_CAPABILITIES if name in checked}
+
+    path = _capabilities_cache_file()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({
+                "key": _capabilities_cache_key(),
+                "capabilities": capabilities
+            }, f)
+    except OSError as e:
+        logger.warning("Could not cache hardware capabilities: %s", e)
+
+
 def get_hardware_detector():
-    """Get the hardware detector instance."""
+    """Get the hardware detector instance.
+
+    Capabilities detected by an earlier run in the same boot are reused
+    from the cache instead of being probed again, except for audio.
+    """
     global _hardware_detector
     if _hardware_detector is None:
-        _hardware_detector = HardwareDetector()
-    return _hardware_detector
\ No newline at end of file
+        _hardware_detector = _load_cached_detector()
+        if _hardware_detector is None:
+            _hardware_detector = HardwareDetector()
+
+        # Cache at exit, so the lazy checks this run needed are cached too
+        checked = _hardware_detector.get_checked_capabilities()
+        if not all(name in checked for name in _CACHED_CAPABILITIES):
+            atexit.register(_save_cached_detector, _hardware_detector)
+    return _hardware_detector
+
+
+def invalidate_audio_cache():
+    """Forget the cached audio check, e.g. after an audio device is plugged in.
+
+    The capabilities cache file is removed as well, so the next process
+    detects everything afresh.
+    """
+    global _audio_available
+    _audio_available = None
+    try:
+        os.remove(_capabilities_cache_file())
+    except OSError:
+        pass
\ No newline at end of file
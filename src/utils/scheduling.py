@@ -0,0 +1,35 @@
+"""
+Thread scheduling helpers for SenseBridge.
+Adjusts the priority and CPU placement of threads where the platform allows.
+"""
+
+import os
+
+
+def lower_thread_priority(increment=5):
+    """Lower the calling thread's scheduling priority.
+
+    On Linux niceness is per thread, so only the caller (and threads it
+    starts afterwards) are affected. Does nothing where os.nice is
+    unavailable or not permitted.
+
+    Args:
+        increment: Amount to add to the niceness value
+    """
+    try:
+        os.nice(increment)
+    except (AttributeError, OSError):
+        pass
+
+
+def pin_thread_to_cpu():
+    """Pin the calling thread to a single CPU.
+
+    Keeps a single-threaded loop, such as a Tk main loop, from migrating
+    between cores. Uses the first CPU the process may run on, and does
+    nothing where CPU affinity is not supported.
+    """
+    try:
+        os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})
+    except (AttributeError, OSError):
+        pass
@@ -22,24 +22,38 @@ def test_speech_recognition():
         r.pause_threshold = 0.3
         r.phrase_threshold = 0.1
 
-        # List available microphones
-        mic_names = sr.Microphone.list_microphone_names()
-        logger.info(f"Found {len(mic_names)} microphones")
+        # Enumerate the audio devices once and keep their info
+        pa = sr.Microphone.get_pyaudio().PyAudio()
+        try:
+            device_infos = [pa.get_device_info_by_index(i) for i in range(pa.get_device_count())]
+        finally:
+            pa.terminate()
+        logger.info("Found %s microphones", len(device_infos))
 
-        for i, name in enumerate(mic_names):
-            logger.info(f"Microphone {i}: {name}")
+        for info in device_infos:
+            logger.info("Microphone %s: %s", info['index'], info['name'])
 
-        # Try different microphones
-        for index in [13, 14, 15, 16, 5, 4, 1, 0]:
-            if index >= len(mic_names):
+        # Ambient noise is calibrated once, on the first working microphone
+        energy_threshold = None
+
+        # Try every device that can record
+        for info in device_infos:
+            if info["maxInputChannels"] <= 0:
                 continue
 
+            index = info["index"]
             try:
-                logger.info(f"Testing microphone {index}: {mic_names[index]}")
+                logger.info("Testing microphone %s: %s", index, info['name'])
                 with sr.Microphone(device_index=index) as source:
-                    logger.info("Adjusting for ambient noise...")
-                    r.adjust_for_ambient_noise(source, duration=2)
-                    logger.info(f"Energy threshold set to {r.energy_threshold}")
+                    if energy_threshold is None:
+                        logger.info("Adjusting for ambient noise...")
+                        r.adjust_for_ambient_noise(source, duration=1)
+                        energy_threshold = r.energy_threshold
+                        logger.info("Energy threshold set to %s", energy_threshold)
+                    else:
+                        # Listening adjusts the threshold dynamically, so start
+                        # each microphone from the calibrated value
+                        r.energy_threshold = energy_threshold
 
                     logger.info("Listening for 10 seconds...")
                     start_time = time.time()
@@ -51,23 +65,23 @@ def test_speech_recognition():
                                 audio = r.listen(source, timeout=3, phrase_time_limit=5)
                                 try:
                                     text = r.recognize_google(audio)
-                                    logger.info(f"Recognized: {text}")
+                                    logger.info("Recognized: %s", text)
                                 except sr.UnknownValueError:
                                     logger.info("Could not understand audio")
                                 except sr.RequestError as e:
-                                    logger.error(f"Google Speech API error: {e}")
+                                    logger.error("Google Speech API error: %s", e)
                             except sr.WaitTimeoutError:
                                 logger.warning("Listening timed out")
                     except Exception as e:
-                        logger.error(f"Error during listening loop: {e}")
+                        logger.error("Error during listening loop: %s", e)
 
-                    logger.info(f"Finished testing microphone {index}")
+                    logger.info("Finished testing microphone %s", index)
 
             except Exception as e:
-                logger.error(f"Error with microphone {index}: {e}")
+                logger.error("Error with microphone %s: %s", index, e)
 
     except Exception as e:
-        logger.error(f"Error in speech recognition test: {e}")
+        logger.error("Error in speech recognition test: %s", e)
 
 
 if __name__ == "__main__":
@@ -40,9 +40,10 @@ def test_audio_processing(duration=3):
     """Test audio processing module."""
     try:
         from src.audio.audio_processor import AudioProcessor
+        from src.utils.hardware_detection import get_hardware_detector
 
         logger.info("Testing audio processor...")
-        processor = AudioProcessor()
+        processor = AudioProcessor(pyaudio_instance=get_hardware_detector().pyaudio_instance)
 
         # Start processor
         processor.start()
@@ -50,15 +51,15 @@ def test_audio_processing(duration=3):
 
         # Get some audio data
         logger.info(f"Capturing audio for {duration} seconds...")
-        start_time = time.time()
+        end_time = time.time() + duration
         samples = []
 
-        while time.time() - start_time < duration:
-            audio_data = processor.get_audio_data(timeout=0.1)
+        # get_audio_data wakes as soon as the capture callback queues a chunk
+        while time.time() < end_time:
+            audio_data = processor.get_audio_data(timeout=end_time - time.time())
             if audio_data is not None:
                 samples.append(audio_data)
                 logger.info(f"Got audio sample, length: {len(audio_data)}")
-            time.sleep(0.1)
 
         # Stop processor
         processor.stop()
@@ -76,6 +77,7 @@ def test_sound_recognition(duration=10):
     """Test sound recognition."""
     try:
         from src.audio.sound_recognition import SoundRecognition
+        from src.utils.hardware_detection import get_hardware_detector
 
         detected_sounds = []
 
@@ -84,7 +86,8 @@ def test_sound_recognition(duration=10):
             detected_sounds.append((sound_type, confidence))
 
         logger.info("Testing sound recognition...")
-        recognition = SoundRecognition(callback=sound_callback)
+        recognition = SoundRecognition(callback=sound_callback,
+                                       pyaudio_instance=get_hardware_detector().pyaudio_instance)
 
         # Start recognition
         recognition.start()
@@ -13,8 +13,9 @@ import threading
 import queue
 import json
 import random
-import numpy as np
-from collections import defaultdict
+from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Setup logging
 logging.basicConfig(
@@ -27,8 +28,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger("SenseBridgeTest")
 
+# Add current directory to Python path
+_CWD = os.path.abspath(os.getcwd())
+if _CWD not in sys.path:
+    sys.path.insert(0, _CWD)
+
+
+@dataclass
+class Results:
+    """Counts of test outcomes."""
+    passed: int = 0
+    failed: int = 0
+    errors: int = 0
+
+    @property
+    def total(self):
+        """Total number of tests run."""
+        return self.passed + self.failed + self.errors
+
+
 # Test result counter
-test_results = defaultdict(int)
+test_results = Results()
 
 
 def run_test(test_name, test_func, *args, **kwargs):
@@ -52,10 +72,10 @@ def run_test(test_name, test_func, *args, **kwargs):
 
         if result:
             logger.info(f"✓ Test passed: {test_name} ({elapsed_time:.2f}s)")
-            test_results["passed"] += 1
+            test_results.passed += 1
         else:
             logger.error(f"✗ Test failed: {test_name} ({elapsed_time:.2f}s)")
-            test_results["failed"] += 1
+            test_results.failed += 1
 
         return result
 
@@ -63,16 +83,12 @@ def run_test(test_name, test_func, *args, **kwargs):
         logger.error(f"✗ Test error: {test_name} - {e}")
         import traceback
         traceback.print_exc()
-        test_results["errors"] += 1
+        test_results.errors += 1
         return False
 
 
 def test_config():
     """Test configuration module."""
-    # Add current directory to Python path
-    if not os.getcwd() in sys.path:
-        sys.path.insert(0, os.getcwd())
-
     # Import configuration
     from src.utils.config import Config
 
@@ -125,10 +141,6 @@ def test_config():
 
 def test_audio_processor(duration=3):
     """Test audio processing module."""
-    # Add current directory to Python path
-    if not os.getcwd() in sys.path:
-        sys.path.insert(0, os.getcwd())
-
     # Import audio processor
     from src.audio.audio_processor import AudioProcessor
 
@@ -143,22 +155,25 @@ def test_audio_processor(duration=3):
 
     # Get some audio data
     logger.info(f"Capturing audio for {duration} seconds...")
-    start_time = time.time()
+    deadline = time.monotonic() + duration
     samples = []
 
-    while time.time() - start_time < duration:
-        audio_data = processor.get_audio_data(timeout=0.1)
+    # Block on the processor's queue until the deadline instead of polling
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        audio_data = processor.get_audio_data(timeout=remaining)
         if audio_data is not None:
             samples.append(audio_data)
-            logger.info(f"Got audio sample, length: {len(audio_data)}")
-        time.sleep(0.1)
 
     # Stop processor
     processor.stop()
     logger.info("Audio processor stopped")
 
     if len(samples) > 0:
-        logger.info(f"Captured {len(samples)} audio samples")
+        mean_length = sum(len(sample) for sample in samples) / len(samples)
+        logger.info(f"Captured {len(samples)} audio samples, mean length: {mean_length:.0f}")
         return True
     else:
         logger.error("No audio samples captured")
@@ -167,10 +182,6 @@ def test_audio_processor(duration=3):
 
 def test_sound_recognition(duration=10):
     """Test sound recognition."""
-    # Add current directory to Python path
-    if not os.getcwd() in sys.path:
-        sys.path.insert(0, os.getcwd())
-
     # Import sound recognition
     from src.audio.sound_recognition import SoundRecognition
 
@@ -207,10 +218,6 @@ def test_sound_recognition(duration=10):
 
 def test_notification():
     """Test notification systems."""
-    # Add current directory to Python path
-    if not os.getcwd() in sys.path:
-        sys.path.insert(0, os.getcwd())
-
     # Import notification manager
     from src.notification.notification_manager import NotificationManager
 
@@ -246,10 +253,6 @@ def test_notification():
 
 def test_gui():
     """Test GUI functionality."""
-    # Add current directory to Python path
-    if not os.getcwd() in sys.path:
-        sys.path.insert(0, os.getcwd())
-
     # Import GUI app
     from src.gui.app import create_app
 
@@ -275,10 +278,6 @@ def test_gui():
 
 def test_hardware():
     """Test hardware control."""
-    # Add current directory to Python path
-    if not os.getcwd() in sys.path:
-        sys.path.insert(0, os.getcwd())
-
     # Import device controller
     from src.hardware.device_control import DeviceController
 
@@ -288,19 +287,8 @@ def test_hardware():
         # Create device controller
         controller = DeviceController()
 
-        # Test LED control
-        logger.info("Testing LED control...")
-        controller.activate_device("led", 0.5)
-        time.sleep(1.0)
-        controller.deactivate_device("led")
-
-        # Test haptic control
-        logger.info("Testing haptic control...")
-        controller.activate_device("haptic", 0.8)
-        time.sleep(1.0)
-        controller.deactivate_device("haptic")
-
-        # Test button callback
+        # Arm the button callback first so the button can be pressed while
+        # the LED and haptic tests run
         button_pressed = threading.Event()
 
         def button_callback():
@@ -308,10 +296,24 @@ def test_hardware():
             button_pressed.set()
 
         controller.set_button_callback(button_callback)
+
+        def test_device(device_name, label, intensity):
+            logger.info(f"Testing {label} control...")
+            controller.activate_device(device_name, intensity)
+            time.sleep(1.0)
+            controller.deactivate_device(device_name)
+
         logger.info("Press the button within 10 seconds...")
 
-        # Wait for button press or timeout
-        button_pressed.wait(10.0)
+        # Test LED and haptic control while waiting for a button press or timeout
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(test_device, "led", "LED", 0.5),
+                executor.submit(test_device, "haptic", "haptic", 0.8),
+                executor.submit(button_pressed.wait, 10.0)
+            ]
+            for future in as_completed(futures):
+                future.result()
 
         if button_pressed.is_set():
             logger.info("Button press detected")
@@ -332,9 +334,8 @@ def test_hardware():
 
 def test_integration(duration=30):
     """Test full system integration."""
-    # Add current directory to Python path
-    if not os.getcwd() in sys.path:
-        sys.path.insert(0, os.getcwd())
+    # Imported here so the other tests don't pay for loading numpy
+    import numpy as np
 
     # Import SenseBridge main class
     from src.main import SenseBridge
@@ -378,38 +379,51 @@ def test_integration(duration=30):
 
     app_thread = threading.Thread(target=run_app)
     app_thread.daemon = True
-    app_thread.start()
 
-    # Wait for application to start
-    time.sleep(2.0)
+    # Script the simulated events as (seconds after start, message, handler, args),
+    # leaving the application two seconds to start
+    schedule = [(4.0, "Simulating button press...", app.on_button_press, ())]
 
-    # Simulate some events during the test
-    logger.info("Simulating events...")
-
-    # Simulate button press
-    time.sleep(2.0)
-    logger.info("Simulating button press...")
-    app.on_button_press()
-
-    # Simulate sound detection
-    time.sleep(2.0)
+    # Simulate sound detection, sharing one noise buffer between events
+    # since the app only reads it
+    audio_data = np.random.default_rng().standard_normal(16000, dtype=np.float32)
+    audio_data *= 0.3
+    offset = 6.0
     for sound_type in ["doorbell", "knock", "alarm", "microwave_beep"]:
-        audio_data = np.random.normal(0, 0.3, 16000).astype(np.float32)
         confidence = random.uniform(0.7, 0.95)
-        logger.info(f"Simulating sound detection: {sound_type} ({confidence:.2f})")
-        app.on_sound_detected(sound_type, confidence, audio_data)
-        time.sleep(2.0)
+        schedule.append((offset, f"Simulating sound detection: {sound_type} ({confidence:.2f})",
+                         app.on_sound_detected, (sound_type, confidence, audio_data)))
+        offset += 2.0
 
     # Simulate speech recognition
-    time.sleep(2.0)
+    offset += 2.0
     for text in ["Hello, this is a test", "SenseBridge is working", "Testing speech recognition"]:
-        logger.info(f"Simulating speech recognition: {text}")
-        app.on_speech_recognized(text)
-        time.sleep(2.0)
+        schedule.append((offset, f"Simulating speech recognition: {text}",
+                         app.on_speech_recognized, (text,)))
+        offset += 2.0
+
+    def run_schedule():
+        # Wait on the application's stop event so the schedule stays on its
+        # deadlines and ends as soon as the application stops
+        start_time = time.monotonic()
+        for event_time, message, handler, args in schedule:
+            if stop_event.wait(start_time + event_time - time.monotonic()):
+                return
+            logger.info(message)
+            handler(*args)
+
+    schedule_thread = threading.Thread(target=run_schedule)
+    schedule_thread.daemon = True
+
+    app_thread.start()
+
+    # Simulate some events during the test
+    logger.info("Simulating events...")
+    schedule_thread.start()
 
-    # Wait for application to complete
+    # Wait for application to complete, allowing for its startup
     logger.info(f"Waiting for test to complete (max {duration} seconds)...")
-    stop_event.wait(timeout=duration)
+    stop_event.wait(timeout=duration + 2.0)
 
     # Stop the application if still running
     if not stop_event.is_set():
@@ -417,12 +431,13 @@ def test_integration(duration=30):
         app.stop()
 
     # Check results
-    sound_events = [event for event in detected_events if event[0] == "sound"]
-    speech_events = [event for event in detected_events if event[0] == "speech"]
+    event_counts = Counter(event[0] for event in detected_events)
+    sound_count = event_counts["sound"]
+    speech_count = event_counts["speech"]
 
-    logger.info(f"Detected {len(sound_events)} sound events and {len(speech_events)} speech events")
+    logger.info(f"Detected {sound_count} sound events and {speech_count} speech events")
 
-    if len(sound_events) > 0 and len(speech_events) > 0:
+    if sound_count > 0 and speech_count > 0:
         logger.info("Integration test completed successfully")
         return True
     else:
@@ -450,6 +465,9 @@ def main():
                                args.notification or args.gui or args.hardware or
                                args.integration)
 
+    # Tests run one at a time: several share the Config singleton, which is
+    # not thread-safe, and the configuration test rewrites the device config
+    # the notification test reads
     if run_all or args.config:
         run_test("Configuration", test_config)
 
@@ -473,13 +491,13 @@ def main():
 
     # Print test summary
     print("\n=== Test Summary ===")
-    print(f"Passed: {test_results['passed']}")
-    print(f"Failed: {test_results['failed']}")
-    print(f"Errors: {test_results['errors']}")
-    print(f"Total:  {sum(test_results.values())}")
+    print(f"Passed: {test_results.passed}")
+    print(f"Failed: {test_results.failed}")
+    print(f"Errors: {test_results.errors}")
+    print(f"Total:  {test_results.total}")
 
     # Return success if all tests passed
-    return test_results['failed'] == 0 and test_results['errors'] == 0
+    return test_results.failed == 0 and test_results.errors == 0
 
 
 if __name__ == "__main__":
@@ -5,7 +5,9 @@ This script updates the configuration to prevent warnings and improve simulation
 """
 
 import os
+import copy
 import json
+import hashlib
 import logging
 import sys
 
@@ -17,174 +19,249 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ConfigUpdater")
 
-
-def update_device_config():
-    """Update the device configuration to prevent warnings."""
-    config_file = os.path.join("config", "device_config.json")
-
-    if not os.path.exists(config_file):
-        logger.error(f"Configuration file {config_file} not found")
-        return False
-
+# orjson is optional and only used to speed up reading and writing configs
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CONFIG_DIR = "config"
+
+# Hash of the config files as last written by this script
+STATE_HASH_FILE = os.path.join(CONFIG_DIR, ".state_hash")
+
+
+def _loads(data):
+    """Decode JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(config):
+    """Encode a config as JSON bytes indented by two spaces."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which json handles
+    return json.dumps(config, indent=2).encode()
+
+
+# Definitions of the sound events simulation needs
+DEFAULT_EVENTS = {
+    "doorbell": {
+        "name": "Doorbell",
+        "priority": "high",
+        "haptic_pattern": "short_double",
+        "visual_pattern": "flash",
+        "notification_text": "Detected: Doorbell",
+        "action": "alert"
+    },
+    "knock": {
+        "name": "Knock",
+        "priority": "high",
+        "haptic_pattern": "short_double",
+        "visual_pattern": "pulse",
+        "notification_text": "Detected: Knock",
+        "action": "alert"
+    },
+    "microwave_beep": {
+        "name": "Microwave Beep",
+        "priority": "medium",
+        "haptic_pattern": "long_single",
+        "visual_pattern": "pulse",
+        "notification_text": "Detected: Microwave Beep",
+        "action": "alert"
+    },
+    "alarm": {
+        "name": "Alarm",
+        "priority": "high",
+        "haptic_pattern": "long_single",
+        "visual_pattern": "flash",
+        "notification_text": "Detected: Alarm",
+        "action": "alert"
+    }
+}
+
+# Changes to make to each config file for simulation mode:
+#   "settings" - values always written into the given sections
+#   "defaults" - top-level entries added only when missing
+SIMULATION_CONFIG = {
+    "device_config.json": {
+        "settings": {
+            "bluetooth": {
+                "simulation_mode": True,
+                "wearable_mac": "00:11:22:33:44:55",  # Dummy MAC for simulation
+                "device_name": "SenseBridge_Simulator"
+            },
+            "audio": {
+                "simulation_mode": True,
+                "use_fallback_classification": True,
+                "sample_rate": 16000,
+                "channels": 1
+            },
+            "hardware": {
+                "simulation_mode": True,
+                "haptic_pin": 18,  # Dummy GPIO pin
+                "led_pin": 23  # Dummy GPIO pin
+            }
+        },
+        "defaults": {}
+    },
+    "user_prefs.json": {
+        "settings": {
+            "speech_to_text": {
+                "enabled": False,  # Disable in simulation to prevent errors
+                "simulation_mode": True,
+                "language": "en-US",
+                "timeout": 5,
+                "phrase_time_limit": 5,
+                "energy_threshold": 300,
+                "adjust_for_ambient_noise": True,
+                "pause_threshold": 0.8
+            },
+            "notifications": {
+                "simulation_mode": True,
+                "haptic_enabled": True,
+                "visual_enabled": True,
+                "smart_home_enabled": False  # Disable smart home integration in simulation
+            },
+            "sound_detection": {
+                "simulation_mode": True,
+                "enabled": True,
+                "sensitivity": 0.7,
+                "use_fallback": True,
+                "min_confidence": 0.6
+            }
+        },
+        "defaults": {
+            "smart_home": {
+                "enabled": False,
+                "mqtt_broker": "localhost",
+                "mqtt_port": 1883,
+                "mqtt_topic": "sensebridge/events"
+            }
+        }
+    },
+    "sound_events.json": {
+        "settings": {},
+        "defaults": DEFAULT_EVENTS
+    }
+}
+
+
+def _patch_json(config_file, settings, defaults):
+    """Apply simulation settings and defaults to a JSON config file.
+
+    Args:
+        config_file: Path to the JSON file
+        settings: Values to write, as {section: {key: value}}
+        defaults: Top-level entries to add when missing
+
+    Returns:
+        True if successful, False otherwise
+    """
     try:
         # Read the current config
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-
-        # Update bluetooth configuration for simulation
-        if "bluetooth" not in config:
-            config["bluetooth"] = {}
-
-        config["bluetooth"]["simulation_mode"] = True
-        config["bluetooth"]["wearable_mac"] = "00:11:22:33:44:55"  # Dummy MAC for simulation
-        config["bluetooth"]["device_name"] = "SenseBridge_Simulator"
-
-        # Update audio configuration for simulation
-        if "audio" not in config:
-            config["audio"] = {}
-
-        config["audio"]["simulation_mode"] = True
-        config["audio"]["use_fallback_classification"] = True
-        config["audio"]["sample_rate"] = 16000
-        config["audio"]["channels"] = 1
-
-        # Update hardware configuration for simulation
-        if "hardware" not in config:
-            config["hardware"] = {}
-
-        config["hardware"]["simulation_mode"] = True
-        config["hardware"]["haptic_pin"] = 18  # Dummy GPIO pin
-        config["hardware"]["led_pin"] = 23  # Dummy GPIO pin
-
-        # Write updated config
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-
-        logger.info(f"Updated device configuration in {config_file}")
+        try:
+            with open(config_file, 'rb') as f:
+                config = _loads(f.read())
+        except FileNotFoundError:
+            logger.error(f"Configuration file {config_file} not found")
+            return False
+        original = copy.deepcopy(config)
+
+        for section, values in settings.items():
+            config.setdefault(section, {}).update(values)
+
+        for key, value in defaults.items():
+            config.setdefault(key, copy.deepcopy(value))
+
+        # Skip the rewrite when nothing changed
+        if config == original:
+            logger.info(f"Configuration in {config_file} is already up to date")
+            return True
+
+        # Write updated config to a temporary file and swap it into place,
+        # so an interrupted write never leaves a truncated config behind
+        temp_file = config_file + ".tmp"
+        try:
+            with open(temp_file, 'wb') as f:
+                f.write(_dumps(config))
+            os.replace(temp_file, config_file)
+        except BaseException:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+            raise
+
+        logger.info(f"Updated configuration in {config_file}")
         return True
 
     except Exception as e:
-        logger.error(f"Error updating device configuration: {str(e)}")
+        logger.error(f"Error updating configuration in {config_file}: {str(e)}")
         return False
 
 
-def update_user_prefs():
-    """Update user preferences to prevent warnings."""
-    config_file = os.path.join("config", "user_prefs.json")
+def _config_state_hash():
+    """Hash the simulation changes together with the config files they apply to.
 
-    if not os.path.exists(config_file):
-        logger.error(f"Configuration file {config_file} not found")
-        return False
-
-    try:
-        # Read the current config
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-
-        # Update speech recognition settings
-        if "speech_to_text" not in config:
-            config["speech_to_text"] = {}
-
-        config["speech_to_text"]["enabled"] = False  # Disable in simulation to prevent errors
-        config["speech_to_text"]["simulation_mode"] = True
-        config["speech_to_text"]["language"] = "en-US"
-        config["speech_to_text"]["timeout"] = 5
-        config["speech_to_text"]["phrase_time_limit"] = 5
-        config["speech_to_text"]["energy_threshold"] = 300
-        config["speech_to_text"]["adjust_for_ambient_noise"] = True
-        config["speech_to_text"]["pause_threshold"] = 0.8
-
-        # Update notifications settings
-        if "notifications" not in config:
-            config["notifications"] = {}
-
-        config["notifications"]["simulation_mode"] = True
-        config["notifications"]["haptic_enabled"] = True
-        config["notifications"]["visual_enabled"] = True
-        config["notifications"]["smart_home_enabled"] = False  # Disable smart home integration in simulation
-
-        # Update sound detection settings
-        if "sound_detection" not in config:
-            config["sound_detection"] = {}
-
-        config["sound_detection"]["simulation_mode"] = True
-        config["sound_detection"]["enabled"] = True
-        config["sound_detection"]["sensitivity"] = 0.7
-        config["sound_detection"]["use_fallback"] = True
-        config["sound_detection"]["min_confidence"] = 0.6
-
-        # Add smart home section if missing
-        if "smart_home" not in config:
-            config["smart_home"] = {}
-            config["smart_home"]["enabled"] = False
-            config["smart_home"]["mqtt_broker"] = "localhost"
-            config["smart_home"]["mqtt_port"] = 1883
-            config["smart_home"]["mqtt_topic"] = "sensebridge/events"
-
-        # Write updated config
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-
-        logger.info(f"Updated user preferences in {config_file}")
-        return True
+    Returns:
+        Hex SHA-256 digest, or None if a config file can't be read
+    """
+    digest = hashlib.sha256(json.dumps(SIMULATION_CONFIG, sort_keys=True).encode())
+    for filename in SIMULATION_CONFIG:
+        try:
+            with open(os.path.join(CONFIG_DIR, filename), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        digest.update(f"{filename}:{len(data)}:".encode())
+        digest.update(data)
+    return digest.hexdigest()
 
-    except Exception as e:
-        logger.error(f"Error updating user preferences: {str(e)}")
-        return False
 
+def _read_state_hash():
+    """Read the hash stored by the last successful update, if any."""
+    try:
+        with open(STATE_HASH_FILE, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
 
-def update_sound_events():
-    """Update sound events configuration for better simulation."""
-    config_file = os.path.join("config", "sound_events.json")
 
-    if not os.path.exists(config_file):
-        logger.error(f"Configuration file {config_file} not found")
-        return False
+def _save_state_hash(state_hash):
+    """Store the hash of the updated config files.
 
+    Args:
+        state_hash: Digest returned by _config_state_hash
+    """
     try:
-        # Read the current config
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-
-        # Ensure all required sound events are defined
-        required_events = ["doorbell", "knock", "microwave_beep", "alarm"]
-
-        for event in required_events:
-            if event not in config:
-                config[event] = {
-                    "name": event.replace("_", " ").title(),
-                    "priority": "high" if event in ["doorbell", "knock", "alarm"] else "medium",
-                    "haptic_pattern": "short_double" if event in ["doorbell", "knock"] else "long_single",
-                    "visual_pattern": "flash" if event in ["doorbell", "alarm"] else "pulse",
-                    "notification_text": f"Detected: {event.replace('_', ' ').title()}",
-                    "action": "alert"
-                }
-
-        # Write updated config
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-
-        logger.info(f"Updated sound events configuration in {config_file}")
-        return True
-
-    except Exception as e:
-        logger.error(f"Error updating sound events configuration: {str(e)}")
-        return False
+        with open(STATE_HASH_FILE, 'w') as f:
+            f.write(state_hash)
+    except OSError as e:
+        logger.warning(f"Could not save configuration state hash: {str(e)}")
 
 
 def ensure_config_directory():
     """Ensure the config directory exists with proper __init__.py."""
-    config_dir = "config"
+    config_dir = CONFIG_DIR
 
-    if not os.path.exists(config_dir):
+    try:
         os.makedirs(config_dir)
         logger.info(f"Created config directory: {config_dir}")
+    except FileExistsError:
+        pass
 
     init_file = os.path.join(config_dir, "__init__.py")
-    if not os.path.exists(init_file):
-        with open(init_file, 'w') as f:
+    try:
+        with open(init_file, 'x') as f:
             f.write('"""Configuration module for SenseBridge."""\n')
         logger.info(f"Created {init_file}")
+    except FileExistsError:
+        pass
 
     return True
 
@@ -198,14 +275,21 @@ def update_simulation_config():
     if not ensure_config_directory():
         success = False
 
-    if not update_device_config():
-        success = False
+    # Nothing to do if the files haven't changed since the last update
+    state_hash = _config_state_hash()
+    if success and state_hash is not None and state_hash == _read_state_hash():
+        logger.info("Configuration files are already up to date")
+        return True
 
-    if not update_user_prefs():
-        success = False
+    for filename, changes in SIMULATION_CONFIG.items():
+        config_file = os.path.join(CONFIG_DIR, filename)
+        if not _patch_json(config_file, changes["settings"], changes["defaults"]):
+            success = False
 
-    if not update_sound_events():
-        success = False
+    if success:
+        state_hash = _config_state_hash()
+        if state_hash is not None:
+            _save_state_hash(state_hash)
 
     return success
 